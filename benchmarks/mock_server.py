@@ -0,0 +1,249 @@
+"""Local stand-in for the CSFloat ``/api/v1`` endpoints used by ``Client``.
+
+Responses are synthetic but shaped like the real API, so request handling, pagination
+and model decoding can be measured without network access or an API key.
+"""
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+__all__ = ("MockCSFloatServer", "make_listing", "make_trade")
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_listing(listing_id: int) -> Dict[str, Any]:
+    created_at = (_EPOCH - timedelta(seconds=listing_id)).isoformat()
+    return {
+        "id": listing_id,
+        "created_at": created_at,
+        "type": "buy_now",
+        "price": 1000 + listing_id % 50000,
+        "description": "",
+        "state": "listed",
+        "seller": {
+            "avatar": "https://avatars.steamstatic.com/avatar.jpg",
+            "away": False,
+            "flags": 0,
+            "has_valid_steam_api_key": True,
+            "obfuscated_id": str(listing_id * 7919),
+            "online": True,
+            "stall_public": True,
+            "statistics": {
+                "median_trade_time": 120.0,
+                "total_avoided_trades": 0,
+                "total_failed_trades": 1,
+                "total_trades": 250,
+                "total_verified_trades": 249,
+            },
+            "steam_id": str(76561198000000000 + listing_id),
+            "username": f"seller{listing_id % 1000}",
+        },
+        "reference": {
+            "base_price": 1200,
+            "float_factor": 1.0,
+            "predicted_price": 1100 + listing_id % 40000,
+            "quantity": 500,
+            "last_updated": created_at,
+        },
+        "item": {
+            "asset_id": 30000000000 + listing_id,
+            "def_index": 7,
+            "paint_index": 44 + listing_id % 20,
+            "paint_seed": listing_id % 1000,
+            "float_value": (listing_id % 9973) / 9973,
+            "icon_url": "-9a81dlWLwJ2UUGcVs_nsVtzdOEdtWwKGZZLQHTxDZ7I56KU0Zwwo4NUX4oFJZEHLbXH5ApeO4YmlhxYQknCRvCo04DEVlxkKgpot7HxfDhjxszJemkV09-5lpKKqPrxN7LEmyVQ7MEpiLuSrYmnjQO3-UdsZGHyd4_Bd1RvNQ7T_FDrw-_ng5Pu75iY1zI97bhLsvQz",
+            "d_param": 1234567890123456789,
+            "is_stattrak": listing_id % 10 == 0,
+            "is_souvenir": False,
+            "rarity": 5,
+            "quality": 4,
+            "market_hash_name": f"AK-47 | Skin {listing_id % 500} (Field-Tested)",
+            "low_rank": listing_id % 1000 or None,
+            "stickers": [
+                {
+                    "stickerId": 4000 + slot,
+                    "slot": slot,
+                    "wear": 0.1 * slot,
+                    "icon_url": "columbus2016/team_nv_holo.png",
+                    "name": f"Sticker | Team {slot} (Holo) | Columbus 2016",
+                    "reference": {"price": 150, "quantity": 30, "updated_at": created_at},
+                }
+                for slot in range(listing_id % 5)
+            ],
+            "tradable": 0,
+            "inspect_link": f"steam://rungame/730/76561202255233023/+csgo_econ_action_preview%20S76561198000000000A{listing_id}D1234",
+            "has_screenshot": True,
+            "is_commodity": False,
+            "type": "skin",
+            "rarity_name": "Classified",
+            "type_name": "Skin",
+            "item_name": f"Skin {listing_id % 500}",
+            "wear_name": "Field-Tested",
+            "description": "It has been painted with a design.",
+            "collection": "The Phoenix Collection",
+            "badges": [],
+        },
+        "is_seller": False,
+        "min_offer_price": 900,
+        "max_offer_discount": 1000,
+        "is_watchlisted": False,
+        "watchers": listing_id % 7,
+    }
+
+
+def make_trade(trade_id: int, state: str = "verified") -> Dict[str, Any]:
+    listing = make_listing(trade_id)
+    created_at = listing["created_at"]
+    user = {"steam_id": str(76561198000000000 + trade_id), "username": f"user{trade_id % 100}", "flags": 0}
+    return {
+        "id": trade_id,
+        "created_at": created_at,
+        "buyer_id": user["steam_id"],
+        "buyer": user,
+        "seller_id": "76561198000000001",
+        "seller": {"steam_id": "76561198000000001", "username": "me"},
+        "contract_id": trade_id,
+        "accepted_at": created_at,
+        "state": state,
+        "verification_mode": "inventory",
+        "steam_offer": {"id": trade_id * 3, "state": 3, "is_from_seller": True, "sent_at": created_at,
+                        "deadline_at": created_at, "updated_at": created_at},
+        "verify_sale_at": created_at,
+        "contract": {key: listing[key] for key in ("id", "created_at", "type", "price", "state", "item")},
+        "wait_for_cancel_ping": False,
+        "is_settlement_period": False,
+    }
+
+
+class MockCSFloatServer:
+    """aiohttp application served on localhost.
+
+    ``latency`` seconds are added to every response (plus up to ``jitter`` seconds),
+    ``total_listings`` bounds the cursor chain of ``/listings``, and a fraction
+    ``rate_limit_ratio`` of requests is answered with 429 and ``Retry-After``.
+    """
+
+    def __init__(
+            self,
+            *,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            total_listings: int = 5000,
+            total_trades: int = 500,
+            rate_limit_ratio: float = 0.0,
+            retry_after: float = 0.05,
+            seed: int = 0
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.total_listings = total_listings
+        self.total_trades = total_trades
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.requests = 0
+        self.rate_limited = 0
+        self._random = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/api/v1/listings", self._listings)
+        self.app.router.add_get("/api/v1/listings/{listing_id}", self._listing)
+        self.app.router.add_get("/api/v1/listings/{listing_id}/similar", self._similar)
+        self.app.router.add_get("/api/v1/listings/{listing_id}/buy-orders", self._buy_orders)
+        self.app.router.add_get("/api/v1/users/{user_id}/stall", self._stall)
+        self.app.router.add_get("/api/v1/me", self._me)
+        self.app.router.add_get("/api/v1/me/trades", self._trades)
+        self.app.router.add_get("/api/v1/meta/exchange-rates", self._exchange_rates)
+        self.app.router.add_post("/api/v1/listings/buy", self._buy)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{bound_port}/api/v1"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockCSFloatServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        self.requests += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.rate_limit_ratio and self._random.random() < self.rate_limit_ratio:
+            self.rate_limited += 1
+            return web.json_response({"message": "slow down"}, status=429,
+                                     headers={"Retry-After": str(self.retry_after)})
+        return await handler(request)
+
+    async def _listings(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 50))
+        offset = int(request.query.get("cursor", 0))
+        end = min(offset + limit, self.total_listings)
+        data: List[Dict[str, Any]] = [make_listing(listing_id) for listing_id in range(offset, end)]
+        body: Dict[str, Any] = {"data": data}
+        if end < self.total_listings:
+            body["cursor"] = str(end)
+        return web.json_response(body)
+
+    async def _listing(self, request: web.Request) -> web.Response:
+        return web.json_response(make_listing(int(request.match_info["listing_id"])))
+
+    async def _similar(self, request: web.Request) -> web.Response:
+        base = int(request.match_info["listing_id"])
+        return web.json_response([make_listing(base + offset) for offset in range(1, 11)])
+
+    async def _buy_orders(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 10))
+        return web.json_response([
+            {"id": str(index), "created_at": _EPOCH.isoformat(), "expression": "", "qty": 1, "price": 900 - index}
+            for index in range(limit)
+        ])
+
+    async def _stall(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 40))
+        return web.json_response({"data": [make_listing(listing_id) for listing_id in range(limit)]})
+
+    async def _me(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "user": {"steam_id": "76561198000000001", "username": "me", "balance": 100000},
+            "pending_offers": 0,
+            "actionable_trades": 0,
+        })
+
+    async def _trades(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get("limit", 30))
+        page = int(request.query.get("page", 0))
+        state = request.query.get("state", "verified").split(",")[0]
+        start = page * limit
+        end = min(start + limit, self.total_trades)
+        trades = [make_trade(self.total_trades - trade_id, state) for trade_id in range(start, end)]
+        return web.json_response({"trades": trades, "count": self.total_trades})
+
+    async def _buy(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        listing_id = int(body["contract_ids"][0])
+        if body["total_price"] != make_listing(listing_id)["price"]:
+            return web.json_response({"code": 4, "message": "price changed"}, status=400)
+        return web.json_response({"message": "all listings purchased"})
+
+    async def _exchange_rates(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": {"usd": 1.0, "eur": 0.92}})
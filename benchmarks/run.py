@@ -0,0 +1,152 @@
+"""Offline benchmarks for ``Client`` against ``MockCSFloatServer``.
+
+    python -m benchmarks.run --latency 0.005 --listings 5000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from csfloat_api import Client, RateLimiter, TokenBucket
+from csfloat_api.batch import fan_out
+from csfloat_api.decoding import decode, json_loads
+from csfloat_api.models.listing import Listing
+from csfloat_api.models.trade import Trade
+
+from .mock_server import MockCSFloatServer, make_listing, make_trade
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def _unlimited() -> RateLimiter:
+    return RateLimiter({name: TokenBucket(1e9) for name in RateLimiter.DEFAULT_BUDGETS})
+
+
+async def bench_requests(base_url: str, count: int, concurrency: int) -> Dict[str, Any]:
+    """Throughput and latency of single-listing GETs issued concurrently."""
+    latencies: List[float] = []
+
+    async with Client("benchmark", base_url=base_url, rate_limiter=_unlimited()) as client:
+        async def timed(listing_id: int) -> Listing:
+            started = time.perf_counter()
+            listing = await client.get_specific_listing(listing_id)
+            latencies.append(time.perf_counter() - started)
+            return listing
+
+        started = time.perf_counter()
+        failures = 0
+        async for result in fan_out(timed, range(count), concurrency=concurrency):
+            failures += not result.ok
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": count,
+        "failures": failures,
+        "requests_per_second": count / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+    }
+
+
+async def bench_pagination(base_url: str, decode_mode: str) -> Dict[str, Any]:
+    """Full cursor chain through ``iter_listings``."""
+    async with Client("benchmark", base_url=base_url, rate_limiter=_unlimited(), decode=decode_mode) as client:
+        started = time.perf_counter()
+        listings = 0
+        async for _ in client.iter_listings(limit=50):
+            listings += 1
+        elapsed = time.perf_counter() - started
+    return {"decode": decode_mode, "listings": listings, "listings_per_second": listings / elapsed,
+            "seconds": elapsed}
+
+
+async def bench_rate_limited(base_url: str, count: int, concurrency: int) -> Dict[str, Any]:
+    """Sustained throughput with the default adaptive limiter while the server injects 429s."""
+    async with Client("benchmark", base_url=base_url) as client:
+        started = time.perf_counter()
+        failures = 0
+        async for result in client.get_listings_many(range(count), concurrency=concurrency):
+            failures += not result.ok
+        elapsed = time.perf_counter() - started
+    return {"requests": count, "failures": failures, "requests_per_second": count / elapsed}
+
+
+def bench_decode(pages: int) -> Dict[str, Any]:
+    """CPU cost of decoding one 50-listing page and one 30-trade page."""
+    listing_body = json.dumps({"data": [make_listing(listing_id) for listing_id in range(50)]}).encode()
+    trade_body = json.dumps({"trades": [make_trade(trade_id) for trade_id in range(30)]}).encode()
+
+    def measure(func: Callable[[], Any]) -> float:
+        started = time.perf_counter()
+        for _ in range(pages):
+            func()
+        return (time.perf_counter() - started) / pages * 1000
+
+    listing_page = json_loads(listing_body)["data"]
+    trade_page = json_loads(trade_body)["trades"]
+    return {
+        "listing_page_parse_ms": measure(lambda: json_loads(listing_body)),
+        "listing_page_validate_ms": measure(lambda: [decode(Listing, item, "validate") for item in listing_page]),
+        "listing_page_lazy_ms": measure(lambda: [decode(Listing, item, "lazy") for item in listing_page]),
+        "trade_page_validate_ms": measure(lambda: [decode(Trade, item, "validate") for item in trade_page]),
+        "trade_page_lazy_ms": measure(lambda: [decode(Trade, item, "lazy") for item in trade_page]),
+    }
+
+
+async def main(arguments: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"decode": bench_decode(arguments.decode_pages)}
+
+    async with MockCSFloatServer(latency=arguments.latency, jitter=arguments.jitter,
+                                 total_listings=arguments.listings) as server:
+        results["requests"] = await bench_requests(server.base_url, arguments.requests, arguments.concurrency)
+        results["pagination"] = [
+            await bench_pagination(server.base_url, decode_mode) for decode_mode in ("validate", "lazy")
+        ]
+
+    async with MockCSFloatServer(latency=arguments.latency, rate_limit_ratio=arguments.rate_limit_ratio) as server:
+        results["rate_limited"] = await bench_rate_limited(server.base_url, arguments.rate_limited_requests,
+                                                           arguments.concurrency)
+        results["rate_limited"]["server_429s"] = server.rate_limited
+    return results
+
+
+def _print(results: Dict[str, Any], prefix: str = "") -> None:
+    for key, value in results.items():
+        if isinstance(value, dict):
+            _print(value, f"{prefix}{key}.")
+        elif isinstance(value, list):
+            for entry in value:
+                _print(entry, f"{prefix}{key}.")
+        elif isinstance(value, float):
+            print(f"{prefix}{key}: {value:.3f}")
+        else:
+            print(f"{prefix}{key}: {value}")
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.002, help="server latency per request, seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, seconds")
+    parser.add_argument("--listings", type=int, default=5000, help="listings in the paginated market")
+    parser.add_argument("--requests", type=int, default=2000, help="single-listing requests to issue")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.05, help="share of requests answered with 429")
+    parser.add_argument("--rate-limited-requests", type=int, default=200)
+    parser.add_argument("--decode-pages", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _parse_arguments()
+    output = asyncio.run(main(args))
+    if args.json:
+        print(json.dumps(output, indent=2))
+    else:
+        _print(output)
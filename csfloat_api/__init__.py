@@ -1,2 +1,23 @@
 from .csfloat_client import Client
+from .batch import BatchResult
+from .cache import MemoryCache, SQLiteCache
+from .cassette import CassettePlayer, CassetteRecorder
+from .decoding import LazyModel
+from .float_index import FloatIndex
+from .frame import ListingFrame
+from .metrics import Hooks, MetricsCollector
+from .pool import ClientPool
+from .rules import Rule, RuleEngine, RuleMatch
+from .sales import SalesAnalyzer, SalesHistory
+from .snipe import Sniper
+from .sweep import MarketSweep, Shard
+from .sync import SyncEngine, SyncIncomplete, SyncTruncated
+from .trade_monitor import TradeEvent, TradeMonitor
+from .store import ListingStore
+from .watcher import ListingEvent, ListingWatcher
+from .exceptions import CSFloatError, HTTPError, TransportError
+from .rate_limit import RateLimiter, TokenBucket
+from .retry import RetryPolicy
+from .transport import TransportConfig
+from . import exceptions
 from . import models
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Field accessors shared by the modules that read listings as models or raw dicts."""
+from datetime import datetime
+from typing import Any
+
+__all__ = ("NAN", "NO_INT", "get_field", "as_int", "as_float", "as_timestamp")
+
+# Missing values: NaN for float columns, -1 for integer columns.
+NAN = float("nan")
+NO_INT = -1
+
+
+def get_field(source: Any, name: str) -> Any:
+    """``name`` of a model, lazy view or raw dict; None when ``source`` is None."""
+    if source is None:
+        return None
+    if isinstance(source, dict):
+        return source.get(name)
+    return getattr(source, name)
+
+
+def as_int(value: Any) -> int:
+    return NO_INT if value is None else int(value)
+
+
+def as_float(value: Any) -> float:
+    return NAN if value is None else float(value)
+
+
+def as_timestamp(value: Any) -> float:
+    """Unix timestamp of a datetime or ISO 8601 string, NaN when missing."""
+    if value is None:
+        return NAN
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterable, Optional, TypeVar
+
+__all__ = ("BatchResult", "fan_out")
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_DONE = object()
+
+
+class BatchResult(Generic[K, V]):
+    """Outcome of one key in a batch: either ``value`` or ``error`` is set."""
+
+    __slots__ = ("key", "value", "error")
+
+    def __init__(self, key: K, value: Optional[V] = None, error: Optional[BaseException] = None) -> None:
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BatchResult(key={self.key!r}, error={self.error!r})"
+        return f"BatchResult(key={self.key!r}, value={self.value!r})"
+
+
+async def fan_out(func: Callable[[K], Awaitable[V]], keys: Iterable[K], *,
+                  concurrency: int = 10) -> AsyncIterator[BatchResult[K, V]]:
+    """Runs ``func`` for every key with at most ``concurrency`` calls in flight.
+
+    Results are yielded in completion order. A failing key is reported through
+    ``BatchResult.error`` and does not cancel the rest of the batch.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pending = iter(keys)
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def worker() -> None:
+        for key in pending:
+            try:
+                value = await func(key)
+            except Exception as exc:
+                await results.put(BatchResult(key, error=exc))
+            else:
+                await results.put(BatchResult(key, value))
+        await results.put(_DONE)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            result: Any = await results.get()
+            if result is _DONE:
+                running -= 1
+                continue
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
@@ -0,0 +1,148 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+__all__ = (
+    "DEFAULT_CACHE_TTLS",
+    "CacheEntry",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+)
+
+# Seconds a cached response is served without asking the server again, per cache group.
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "exchange_rates": 300.0,
+    "location": 3600.0,
+    "sales": 60.0,
+    "me": 5.0,
+}
+
+
+class CacheEntry:
+    __slots__ = ("value", "expires_at", "etag", "last_modified")
+
+    def __init__(self, value: Any, expires_at: float, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached responses.
+
+    Stale entries are kept so that their validators can be sent with the next request.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache."""
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    """On-disk cache that several processes can share through the same database file.
+
+    Lookups run on the event loop, so a locked database is waited on for at most
+    ``busy_timeout`` seconds; after that a read counts as a miss and a write is skipped.
+    """
+
+    __slots__ = ("path", "_connection", "_lock")
+
+    def __init__(self, path: str, *, busy_timeout: float = 0.05) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        self._connection.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT value, expires_at, etag, last_modified FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1], row[2], row[3])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(entry.value), entry.expires_at, entry.etag, entry.last_modified),
+                )
+        except sqlite3.OperationalError:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+        except sqlite3.OperationalError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._connection.close()
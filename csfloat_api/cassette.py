@@ -0,0 +1,251 @@
+"""Record real API traffic to a compressed cassette file and replay it without a network.
+
+A cassette starts with ``MAGIC`` followed by one record per response::
+
+    >I  length of key + payload
+    >H  length of key
+    >d  seconds since the recording started
+    key      "METHOD /path?query", plus "\\n" and the canonical JSON body for requests with one
+    payload  zlib("{meta JSON}\\n" + response body)
+
+Keys are stored uncompressed so a replay only has to scan the record headers of the
+memory-mapped file to build its index; payloads are decompressed when they are served.
+"""
+import asyncio
+import inspect
+import json
+import mmap
+import struct
+import time
+import zlib
+from typing import (TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Tuple,
+                    Union)
+
+from multidict import CIMultiDict
+
+from .decoding import json_dumps, json_loads
+from .exceptions import CassetteMiss, HTTPError
+from .rate_limit import parse_retry_after
+from .transport import TransportBackend
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+    from .metrics import RequestInfo
+
+__all__ = ("CassetteRecorder", "CassettePlayer", "replay")
+
+MAGIC = b"CSFCAS1\n"
+_RECORD = struct.Struct(">IHd")
+
+# Response headers the client acts on; everything else is dropped from the cassette.
+_KEPT_HEADERS = ("ETag", "Last-Modified", "Retry-After", "X-RateLimit-Remaining", "X-RateLimit-Reset")
+
+
+def _key(method: str, parameters: str, json_data: Any) -> str:
+    key = f"{method} {parameters}"
+    if json_data is not None:
+        key += "\n" + json.dumps(json_data, sort_keys=True, separators=(",", ":"))
+    return key
+
+
+class CassetteRecorder(TransportBackend):
+    """Sends requests over the network and appends every response to ``path``.
+
+    HTTP error responses are recorded too, so a replay raises the same exceptions; requests
+    that fail before a response arrives are not. Records are written as they arrive.
+    """
+
+    __slots__ = ("path", "level", "records", "_file", "_started")
+
+    def __init__(self, path: str, *, level: int = 6) -> None:
+        self.path = path
+        self.level = level
+        self.records = 0
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._started = time.monotonic()
+
+    async def send(self, client: "Client", method: str, parameters: str, budget: str, json_data: Any,
+                   headers: Optional[Dict[str, str]], info: "RequestInfo") -> Tuple[int, Mapping[str, str], Any]:
+        offset = time.monotonic() - self._started
+        started = time.perf_counter()
+        try:
+            status, response_headers, data = await client._send(
+                method, f"{client.base_url}{parameters}", budget, json_data, headers, info)
+        except HTTPError as exc:
+            kept = {"Retry-After": str(exc.retry_after)} if exc.retry_after is not None else {}
+            self._write(_key(method, parameters, json_data), offset, time.perf_counter() - started,
+                        exc.status, kept, exc.body)
+            raise
+        kept = {name: response_headers[name] for name in _KEPT_HEADERS if name in response_headers}
+        self._write(_key(method, parameters, json_data), offset, time.perf_counter() - started,
+                    status, kept, data)
+        return status, response_headers, data
+
+    def _write(self, key: str, offset: float, elapsed: float, status: int, headers: Dict[str, str],
+               data: Any) -> None:
+        meta = json_dumps({"elapsed": elapsed, "status": status, "headers": headers})
+        body = json_dumps(data) if data is not None else b""
+        key_bytes = key.encode()
+        payload = zlib.compress(meta + b"\n" + body, self.level)
+        self._file.write(_RECORD.pack(len(key_bytes) + len(payload), len(key_bytes), offset))
+        self._file.write(key_bytes)
+        self._file.write(payload)
+        self.records += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    async def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class CassettePlayer(TransportBackend):
+    """Answers requests from a cassette written by ``CassetteRecorder``.
+
+    Repeated requests get the recorded responses in order and the last one once they run
+    out. ``speed=None`` answers immediately; otherwise every response is delayed by its
+    recorded latency divided by ``speed`` (1.0 is real time). Unrecorded requests raise
+    ``CassetteMiss``, or go to the network when ``fallback`` is set. The client's rate
+    limiter is bypassed unless ``rate_limited`` is set.
+    """
+
+    __slots__ = ("path", "speed", "fallback", "rate_limited", "_file", "_map", "_index", "_order", "_cursors")
+
+    def __init__(self, path: str, *, speed: Optional[float] = None, fallback: bool = False,
+                 rate_limited: bool = False) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self.path = path
+        self.speed = speed
+        self.fallback = fallback
+        self.rate_limited = rate_limited
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{path} is not a cassette")
+        # key -> [(payload offset, payload length)], and (recorded at, key) in recorded order.
+        self._index: Dict[str, List[Tuple[int, int]]] = {}
+        self._order: List[Tuple[float, str]] = []
+        self._cursors: Dict[str, int] = {}
+        self._scan()
+
+    def _scan(self) -> None:
+        position, size = len(MAGIC), len(self._map)
+        while position + _RECORD.size <= size:
+            length, key_length, recorded_at = _RECORD.unpack_from(self._map, position)
+            start = position + _RECORD.size
+            if start + length > size:
+                break  # Truncated last record from an interrupted recording.
+            key = self._map[start:start + key_length].decode()
+            self._index.setdefault(key, []).append((start + key_length, length - key_length))
+            self._order.append((recorded_at, key))
+            position = start + length
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _load(self, offset: int, length: int) -> Tuple[Dict[str, Any], bytes]:
+        meta, _, body = zlib.decompress(self._map[offset:offset + length]).partition(b"\n")
+        return json_loads(meta), body
+
+    def rewind(self) -> None:
+        """Starts serving every request from its first recorded response again."""
+        self._cursors.clear()
+
+    def requests(self) -> Iterator[Tuple[float, str, str, Any]]:
+        """``(offset seconds, method, parameters, json_data)`` of every record, in recorded order."""
+        for recorded_at, key in self._order:
+            request, _, body = key.partition("\n")
+            method, _, parameters = request.partition(" ")
+            yield recorded_at, method, parameters, json.loads(body) if body else None
+
+    async def send(self, client: "Client", method: str, parameters: str, budget: str, json_data: Any,
+                   headers: Optional[Dict[str, str]], info: "RequestInfo") -> Tuple[int, Mapping[str, str], Any]:
+        key = _key(method, parameters, json_data)
+        entries = self._index.get(key)
+        if not entries:
+            if self.fallback:
+                return await client._send(method, f"{client.base_url}{parameters}", budget, json_data, headers, info)
+            raise CassetteMiss(f"No recorded response for {method} {parameters}")
+        position = self._cursors.get(key, 0)
+        self._cursors[key] = position + 1
+        meta, body = self._load(*entries[min(position, len(entries) - 1)])
+        if self.speed is not None:
+            await asyncio.sleep(meta["elapsed"] / self.speed)
+
+        status = info.status = meta["status"]
+        response_headers = CIMultiDict(meta["headers"])
+        if self.rate_limited:
+            retry_after = client.rate_limiter.feedback(budget, status, response_headers)
+        else:
+            retry_after = parse_retry_after(response_headers)
+        if status == 429:
+            client._emit('on_rate_limited', info, retry_after)
+        if status == 304:
+            return status, response_headers, None
+
+        info.bytes_received = len(body)
+        info.mark('decode')
+        data = json_loads(body) if body else None
+        info.measure('decode', 'decode')
+        if status != 200:
+            raise client._error(status, data, retry_after)
+        return status, response_headers, data
+
+    async def close(self) -> None:
+        if not self._file.closed:
+            self._map.close()
+            self._file.close()
+
+
+async def replay(
+        client: "Client",
+        player: Union[CassettePlayer, str],
+        *,
+        speed: Optional[float] = None,
+        concurrency: int = 10,
+        on_response: Optional[Callable[[str, str, Any], Optional[Awaitable[Any]]]] = None
+) -> int:
+    """Re-issues every recorded request through ``client`` and returns how many were sent.
+
+    Requests start at their recorded offsets divided by ``speed`` (``None`` sends them as
+    fast as ``concurrency`` allows). ``on_response(method, parameters, result)`` receives the
+    response data, or the exception the request raised. ``client`` is normally built with
+    a ``CassettePlayer`` backend so the whole pipeline runs offline.
+    """
+    owned = isinstance(player, str)
+    if owned:
+        player = CassettePlayer(player)
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+    started = time.monotonic()
+
+    async def issue(method: str, parameters: str, json_data: Any) -> None:
+        try:
+            result = await client._request(method, parameters, json_data)
+        except Exception as exc:
+            result = exc
+        finally:
+            semaphore.release()
+        if on_response is not None:
+            outcome = on_response(method, parameters, result)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+    try:
+        for offset, method, parameters, json_data in player.requests():
+            if speed is not None:
+                delay = offset / speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(issue(method, parameters, json_data)))
+        await asyncio.gather(*tasks)
+    finally:
+        if owned:
+            await player.close()
+    return len(tasks)
@@ -1,15 +1,27 @@
+import asyncio
+import copy
+import hashlib
+import time
 import aiohttp
 import re
 from aiohttp_socks.connector import ProxyConnector
-from aiohttp.resolver import ThreadedResolver
-from typing import Iterable, Union, Optional, Dict, List, Any, Literal
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Tuple, Union, Optional, Dict, List, Any, Literal
 
 # Import the Pydantic models
 from .models.listing import Listing
 from .models.buy_orders import BuyOrders
 from .models.me import Me
+from .models.sale import Sale
 from .models.stall import Stall
 from .models.trade import Trade
+from .rate_limit import RateLimiter, PRIORITY_HIGH, PRIORITY_NORMAL
+from .retry import RetryPolicy
+from .batch import BatchResult, fan_out
+from .cache import CacheBackend, CacheEntry, DEFAULT_CACHE_TTLS
+from .decoding import DECODE_MODES, decode as decode_model, json_loads
+from .exceptions import CSFloatError, InvalidResponse, MethodNotAllowed, NotFound, TransportError, error_for_status
+from .metrics import Hooks, RequestInfo, build_trace_config, endpoint_name
+from .transport import TransportBackend, TransportConfig
 
 __all__ = ("Client",)
 
@@ -34,44 +46,86 @@ class Client:
     __slots__ = (
         "API_KEY",
         "proxy",
+        "base_url",
         "_headers",
         "_connector",
-        "_session"
+        "_session",
+        "_rate_limiter",
+        "_retry_policy",
+        "_cache",
+        "_cache_ttls",
+        "_inflight",
+        "_decode",
+        "_hooks",
+        "_transport",
+        "_backend"
     )
 
-    def __init__(self, api_key: str, proxy: Optional[str] = None) -> None:
+    def __init__(self, api_key: str, proxy: Optional[str] = None, *,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[CacheBackend] = None,
+                 cache_ttls: Optional[Dict[str, float]] = None,
+                 decode: str = 'validate',
+                 base_url: str = _API_URL,
+                 hooks: Iterable[Hooks] = (),
+                 transport: Optional[TransportConfig] = None,
+                 backend: Optional[TransportBackend] = None) -> None:
         self.API_KEY = api_key
         self.proxy = proxy
+        self.base_url = base_url.rstrip('/')
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._cache = cache
+        self._cache_ttls = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._validate_decode(decode)
+        self._decode = decode
+        self._hooks = list(hooks)
+        self._transport = transport if transport is not None else TransportConfig()
+        self._backend = backend
         self._validate_proxy()
         self._headers = {
             'Authorization': self.API_KEY
         }
 
-        safe_resolver = ThreadedResolver()
-
+        connector_options = self._transport.connector_options()
         if self.proxy:
-            self._connector = ProxyConnector.from_url(
-                self.proxy,
-                ttl_dns_cache=300,
-                resolver=safe_resolver
-            )
+            self._connector = ProxyConnector.from_url(self.proxy, **connector_options)
         else:
-            self._connector = aiohttp.TCPConnector(
-                resolver=safe_resolver,
-                limit_per_host=50
-            )
+            self._connector = aiohttp.TCPConnector(**connector_options)
 
-        self._session = aiohttp.ClientSession(connector=self._connector, headers=self._headers)
+        trace_configs = [build_trace_config()] if self._hooks else None
+        self._session = aiohttp.ClientSession(connector=self._connector, headers=self._headers,
+                                              timeout=self._transport.timeout(), trace_configs=trace_configs)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self._session.close()
+        await self.close()
 
     async def close(self):
+        if self._backend is not None:
+            await self._backend.close()
         await self._session.close()
 
+    async def warm_up(self, connections: int = 1) -> int:
+        """Opens up to ``connections`` keep-alive connections ahead of time, e.g. before a trading window.
+
+        Sends lightweight HEAD requests outside the rate limiter; returns how many connections succeeded.
+        """
+        async def open_connection() -> bool:
+            try:
+                async with self._session.head(self.base_url, allow_redirects=False) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return False
+            return True
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)))
+        return sum(results)
+
     def _validate_proxy(self) -> None:
         """Validates the proxy URL format."""
         if not self.proxy:
@@ -84,27 +138,159 @@ class Client:
         if not port.isdigit() or not (1 <= int(port) <= 65535):
             raise ValueError(f"Invalid port in proxy URL: {port}")
 
-    async def _request(self, method: str, parameters: str, json_data: Any = None) -> Optional[dict]:
-        if method not in self._SUPPORTED_METHODS:
-            raise ValueError('Unsupported HTTP method.')
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
 
-        url = f'{_API_URL}{parameters}'
+    @property
+    def transport(self) -> TransportConfig:
+        return self._transport
 
-        async with self._session.request(method=method, url=url, ssl=False, json=json_data) as response:
-            if response.status in self.ERROR_MESSAGES:
-                raise Exception(self.ERROR_MESSAGES[response.status])
+    async def _request(self, method: str, parameters: str, json_data: Any = None,
+                       priority: int = PRIORITY_NORMAL, cache_group: Optional[str] = None) -> Optional[dict]:
+        if method not in self._SUPPORTED_METHODS:
+            raise ValueError('Unsupported HTTP method.')
 
-            if response.status != 200:
+        if cache_group is not None and method == 'GET':
+            return await self._cached_get(parameters, cache_group, priority)
+
+        _, _, data = await self._fetch(method, parameters, json_data, priority)
+        return data
+
+    async def _cached_get(self, parameters: str, cache_group: str, priority: int) -> Optional[dict]:
+        """Serves fresh cached responses and collapses concurrent identical GETs into one call.
+
+        Every caller gets its own copy, so mutating a result cannot corrupt the cache or the
+        results of callers that shared the same request.
+        """
+        key = parameters
+        if cache_group == 'me':
+            key = f'{hashlib.sha256(self.API_KEY.encode()).hexdigest()[:16]}:{parameters}'
+
+        entry = self._cache.get(key) if self._cache is not None else None
+        if entry is not None and entry.fresh:
+            return copy.deepcopy(entry.value)
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._revalidate(key, parameters, cache_group, entry, priority))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda future: self._forget_inflight(key, future))
+        return copy.deepcopy(await asyncio.shield(inflight))
+
+    def _forget_inflight(self, key: str, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not future.cancelled():
+            future.exception()
+
+    async def _revalidate(self, key: str, parameters: str, cache_group: str, entry: Optional[CacheEntry],
+                          priority: int) -> Optional[dict]:
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        status, response_headers, data = await self._fetch('GET', parameters, priority=priority,
+                                                           headers=headers or None)
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        if status == 304 and entry is not None:
+            data = entry.value
+            etag = etag or entry.etag
+            last_modified = last_modified or entry.last_modified
+
+        ttl = self._cache_ttls.get(cache_group, 0)
+        if self._cache is not None and ttl > 0:
+            self._cache.set(key, CacheEntry(data, time.time() + ttl, etag, last_modified))
+        return data
+
+    async def _fetch(self, method: str, parameters: str, json_data: Any = None, priority: int = PRIORITY_NORMAL,
+                     headers: Optional[Dict[str, str]] = None) -> Tuple[int, Mapping[str, str], Any]:
+        url = f'{self.base_url}{parameters}'
+        budget = self._rate_limiter.classify(method, parameters)
+        attempt = 1
+        while True:
+            info = RequestInfo(method, parameters, attempt)
+            info.mark('wait')
+            if self._backend is None or self._backend.rate_limited:
+                await self._rate_limiter.acquire(budget, priority)
+            info.measure('wait', 'wait')
+            self._emit('on_request_start', info)
+            try:
+                if self._backend is not None:
+                    result = await self._backend.send(self, method, parameters, budget, json_data, headers, info)
+                else:
+                    result = await self._send(method, url, budget, json_data, headers, info)
+            except CSFloatError as exc:
+                info.error = exc
+                info.finish()
+                self._emit('on_request_end', info)
+                if not self._retry_policy.should_retry(method, exc, attempt):
+                    raise
+                delay = self._retry_policy.delay(attempt, getattr(exc, "retry_after", None))
+                self._emit('on_retry', info, delay)
+            else:
+                info.finish()
+                self._emit('on_request_end', info)
+                return result
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _emit(self, event: str, *args: Any) -> None:
+        for hook in self._hooks:
+            getattr(hook, event)(*args)
+
+    def _validated(self, method: str, parameters: str, build: Callable[[], Any]) -> Any:
+        """Runs ``build`` (model decoding of a response) and reports its duration to the hooks."""
+        if not self._hooks:
+            return build()
+        started = time.perf_counter()
+        result = build()
+        self._emit('on_validate', method, endpoint_name(parameters), time.perf_counter() - started)
+        return result
+
+    def _error(self, status: int, error_details: Any, retry_after: Optional[float]) -> CSFloatError:
+        message = self.ERROR_MESSAGES.get(status, f'Error: {status}\nResponse Body: {error_details}')
+        return error_for_status(status, message, body=error_details, retry_after=retry_after)
+
+    async def _send(self, method: str, url: str, budget: str, json_data: Any,
+                    headers: Optional[Dict[str, str]], info: RequestInfo) -> Tuple[int, Mapping[str, str], Any]:
+        try:
+            async with self._session.request(method=method, url=url, json=json_data,
+                                             headers=headers, trace_request_ctx=info) as response:
+                info.status = response.status
+                retry_after = self._rate_limiter.feedback(budget, response.status, response.headers)
+                if response.status == 429:
+                    self._emit('on_rate_limited', info, retry_after)
+
+                if response.status == 304:
+                    return response.status, response.headers, None
+
+                if response.status != 200:
+                    try:
+                        error_details = await response.json()
+                    except Exception:
+                        error_details = await response.text()
+                    raise self._error(response.status, error_details, retry_after)
+
+                if response.content_type != 'application/json':
+                    raise InvalidResponse(f"Expected JSON, got {response.content_type}")
+
+                info.mark('body')
+                body = await response.read()
+                info.measure('body', 'body')
+                info.bytes_received = len(body)
+                info.mark('decode')
                 try:
-                    error_details = await response.json()
-                except Exception:
-                    error_details = await response.text()
-                raise Exception(f'Error: {response.status}\nResponse Body: {error_details}')
-
-            if response.content_type != 'application/json':
-                raise Exception(f"Expected JSON, got {response.content_type}")
-
-            return await response.json()
+                    data = json_loads(body)
+                except ValueError as exc:
+                    raise InvalidResponse(f"Malformed JSON in response: {exc}") from exc
+                info.measure('decode', 'decode')
+                return response.status, response.headers, data
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as exc:
+            raise TransportError(f'{type(exc).__name__}: {exc}') from exc
 
     def _validate_category(self, category: int) -> None:
         if category not in (0, 1, 2, 3):
@@ -128,14 +314,24 @@ class Client:
         if role not in valid_roles:
             raise ValueError(f'Unknown role parameter: {role}')
 
+    def _validate_decode(self, decode: str) -> None:
+        if decode not in DECODE_MODES:
+            raise ValueError(f'Unknown decode parameter "{decode}"')
+
+    def _decode_mode(self, decode: Optional[str]) -> str:
+        if decode is None:
+            return self._decode
+        self._validate_decode(decode)
+        return decode
+
     async def get_exchange_rates(self) -> Optional[dict]:
-        return await self._request(method="GET", parameters="/meta/exchange-rates")
+        return await self._request(method="GET", parameters="/meta/exchange-rates", cache_group="exchange_rates")
 
     async def get_me(self, *, raw_response: bool = False) -> Union[Me, dict]:
-        response = await self._request(method="GET", parameters="/me")
+        response = await self._request(method="GET", parameters="/me", cache_group="me")
         if raw_response:
             return response
-        return Me.model_validate(response)
+        return self._validated("GET", "/me", lambda: Me.model_validate(response))
 
     async def get_transactions(self, page: int = 0, limit: int = 10):
         return await self._request(method="GET", parameters=f"/me/transactions?page={page}&limit={limit}&order=desc")
@@ -144,19 +340,21 @@ class Client:
         return await self._request(method="GET", parameters="/me/account-standing")
 
     async def get_location(self) -> Optional[dict]:
-        return await self._request(method="GET", parameters="/meta/location")
+        return await self._request(method="GET", parameters="/meta/location", cache_group="location")
 
-    async def get_pending_trades(self, limit: int = 500, page: int = 0) -> List[Trade]:
+    async def get_pending_trades(self, limit: int = 500, page: int = 0, *, decode: Optional[str] = None) -> List[Trade]:
+        decode = self._decode_mode(decode)
         parameters = f"/me/trades?state=pending&limit={limit}&page={page}"
         response = await self._request(method="GET", parameters=parameters)
-        return [Trade.model_validate(raw_trade) for raw_trade in response.get("trades", [])]
+        return self._validated("GET", parameters, lambda: [
+            decode_model(Trade, raw_trade, decode) for raw_trade in response.get("trades", [])])
 
     async def get_similar(self, *, listing_id: int, raw_response: bool = False) -> Union[List[Listing], dict]:
         parameters = f"/listings/{listing_id}/similar"
         response = await self._request(method="GET", parameters=parameters)
         if raw_response:
             return response
-        return [Listing.model_validate(item) for item in response]
+        return self._validated("GET", parameters, lambda: [Listing.model_validate(item) for item in response])
 
     async def get_buy_orders(self, *, listing_id: int, limit: int = 10, raw_response: bool = False) -> Union[
         List[BuyOrders], dict]:
@@ -164,16 +362,38 @@ class Client:
         response = await self._request(method="GET", parameters=parameters)
         if raw_response:
             return response
-        return [BuyOrders.model_validate(item) for item in response]
+        return self._validated("GET", parameters, lambda: [BuyOrders.model_validate(item) for item in response])
+
+    def get_similar_many(self, listing_ids: Iterable[int], *, concurrency: int = 10,
+                         raw_response: bool = False) -> AsyncIterator[BatchResult]:
+        return fan_out(lambda listing_id: self.get_similar(listing_id=listing_id, raw_response=raw_response),
+                       listing_ids, concurrency=concurrency)
+
+    def get_buy_orders_many(self, listing_ids: Iterable[int], *, limit: int = 10, concurrency: int = 10,
+                            raw_response: bool = False) -> AsyncIterator[BatchResult]:
+        return fan_out(
+            lambda listing_id: self.get_buy_orders(listing_id=listing_id, limit=limit, raw_response=raw_response),
+            listing_ids, concurrency=concurrency)
 
     async def get_my_buy_orders(self, *, page: int = 0, limit: int = 10):
         return await self._request(method="GET", parameters=f"/me/buy-orders?page={page}&limit={limit}&order=desc")
 
-    async def get_sales(self, market_hash_name: str, paint_index: Optional[int] = None):
+    async def get_sales(self, market_hash_name: str, paint_index: Optional[int] = None, *,
+                        raw_response: bool = False, decode: Optional[str] = None) -> Union[List[Sale], list]:
+        decode = self._decode_mode(decode)
         parameters = f"/history/{market_hash_name}/sales"
         if paint_index is not None:
             parameters += f"?paint_index={paint_index}"
-        return await self._request(method="GET", parameters=parameters)
+        response = await self._request(method="GET", parameters=parameters, cache_group="sales")
+        if raw_response:
+            return response
+        return self._validated("GET", parameters, lambda: [decode_model(Sale, item, decode) for item in response])
+
+    def get_sales_many(self, market_hash_names: Iterable[str], *, paint_index: Optional[int] = None,
+                       concurrency: int = 10, raw_response: bool = False) -> AsyncIterator[BatchResult]:
+        return fan_out(
+            lambda market_hash_name: self.get_sales(market_hash_name, paint_index, raw_response=raw_response),
+            market_hash_names, concurrency=concurrency)
 
     async def get_all_listings(
             self,
@@ -194,8 +414,10 @@ class Client:
             collection: Optional[str] = None,
             market_hash_name: Optional[str] = None,
             type_: str = 'buy_now',
-            raw_response: bool = False
+            raw_response: bool = False,
+            decode: Optional[str] = None
     ) -> Union[Dict[str, Any], dict]:
+        decode = self._decode_mode(decode)
         self._validate_category(category)
         self._validate_sort_by(sort_by)
         self._validate_type(type_)
@@ -222,22 +444,75 @@ class Client:
         if raw_response:
             return response
 
-        listings = [Listing.model_validate(item) for item in response.get("data", [])]
+        listings = self._validated('GET', parameters, lambda: [
+            decode_model(Listing, item, decode) for item in response.get("data", [])])
         return {"listings": listings, "cursor": response.get("cursor")}
 
+    async def iter_listings(self, *, cursor: Optional[str] = None, prefetch: int = 2, decode: Optional[str] = None,
+                            **filters: Any) -> AsyncIterator[Listing]:
+        """Yields listings one by one, following ``cursor`` across pages.
+
+        Accepts the same filters as ``get_all_listings``. The next page is requested in the
+        background while the current one is consumed; at most ``prefetch`` pages are buffered.
+        """
+        filters.pop("raw_response", None)
+        decode = self._decode_mode(decode)
+        pages: asyncio.Queue = asyncio.Queue(maxsize=max(prefetch, 1))
+
+        async def produce() -> None:
+            next_cursor = cursor
+            try:
+                while True:
+                    response = await self.get_all_listings(cursor=next_cursor, raw_response=True, **filters)
+                    data = response.get("data") or []
+                    next_cursor = response.get("cursor")
+                    await pages.put(data)
+                    if not data or not next_cursor:
+                        break
+            except Exception as exc:
+                await pages.put(exc)
+                return
+            await pages.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await pages.get()
+                if page is None:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                for listing in self._validated('GET', '/listings', lambda: [
+                        decode_model(Listing, item, decode) for item in page]):
+                    yield listing
+        finally:
+            producer.cancel()
+
     async def get_specific_listing(self, listing_id: int, *, raw_response: bool = False) -> Union[Listing, dict]:
         parameters = f'/listings/{listing_id}'
         response = await self._request(method='GET', parameters=parameters)
         if raw_response:
             return response
-        return Listing.model_validate(response)
+        return self._validated('GET', parameters, lambda: Listing.model_validate(response))
+
+    def get_listings_many(self, listing_ids: Iterable[int], *, concurrency: int = 10,
+                          raw_response: bool = False) -> AsyncIterator[BatchResult]:
+        return fan_out(lambda listing_id: self.get_specific_listing(listing_id, raw_response=raw_response),
+                       listing_ids, concurrency=concurrency)
 
-    async def get_stall(self, user_id: int, *, limit: int = 40, raw_response: bool = False) -> Union[Stall, dict]:
+    async def get_stall(self, user_id: int, *, limit: int = 40, cursor: Optional[str] = None,
+                        raw_response: bool = False) -> Union[Stall, dict]:
         parameters = f'/users/{user_id}/stall?limit={limit}'
+        if cursor: parameters += f'&cursor={cursor}'
         response = await self._request(method='GET', parameters=parameters)
         if raw_response:
             return response
-        return Stall.model_validate(response)
+        return self._validated('GET', parameters, lambda: Stall.model_validate(response))
+
+    def get_stalls_many(self, user_ids: Iterable[int], *, limit: int = 40, concurrency: int = 10,
+                        raw_response: bool = False) -> AsyncIterator[BatchResult]:
+        return fan_out(lambda user_id: self.get_stall(user_id, limit=limit, raw_response=raw_response),
+                       user_ids, concurrency=concurrency)
 
     async def get_inventory(self):
         return await self._request(method="GET", parameters="/me/inventory")
@@ -248,18 +523,23 @@ class Client:
     async def get_offers(self, limit: int = 40):
         return await self._request(method="GET", parameters=f"/me/offers-timeline?limit={limit}")
 
-    async def get_trade_history(self, role: str = "seller", limit: int = 30, page: int = 0) -> List[Trade]:
+    async def get_trade_history(self, role: str = "seller", limit: int = 30, page: int = 0, *,
+                                decode: Optional[str] = None) -> List[Trade]:
+        decode = self._decode_mode(decode)
         self._validate_role(role)
         parameters = f"/me/trades?role={role}&state=failed,cancelled,verified&limit={limit}&page={page}"
         response = await self._request(method="GET", parameters=parameters)
-        return [Trade.model_validate(raw_trade) for raw_trade in response.get("trades", [])]
+        return self._validated("GET", parameters, lambda: [
+            decode_model(Trade, raw_trade, decode) for raw_trade in response.get("trades", [])])
 
-    async def get_trades(self, role: Literal["seller", "buyer"] = "seller", limit: int = 30, page: int = 0) -> List[
-        Trade]:
+    async def get_trades(self, role: Literal["seller", "buyer"] = "seller", limit: int = 30, page: int = 0, *,
+                         decode: Optional[str] = None) -> List[Trade]:
+        decode = self._decode_mode(decode)
         self._validate_role(role)
         parameters = f"/me/trades?role={role}&limit={limit}&page={page}"
         response = await self._request(method="GET", parameters=parameters)
-        return [Trade.model_validate(raw_trade) for raw_trade in response.get("trades", [])]
+        return self._validated("GET", parameters, lambda: [
+            decode_model(Trade, raw_trade, decode) for raw_trade in response.get("trades", [])])
 
     async def delete_listing(self, *, listing_id: int):
         return await self._request(method="DELETE", parameters=f"/listings/{listing_id}")
@@ -282,6 +562,24 @@ class Client:
             description: str = "",
             private: bool = False,
     ) -> Optional[dict]:
+        json_data = self._listing_payload(
+            asset_id=asset_id, price=price, type_=type_, max_offer_discount=max_offer_discount,
+            reserve_price=reserve_price, duration_days=duration_days, description=description, private=private
+        )
+        return await self._request(method="POST", parameters="/listings", json_data=json_data)
+
+    def _listing_payload(
+            self,
+            *,
+            asset_id: str,
+            price: float,
+            type_: str = "buy_now",
+            max_offer_discount: Optional[int] = None,
+            reserve_price: Optional[float] = None,
+            duration_days: Optional[int] = None,
+            description: str = "",
+            private: bool = False,
+    ) -> Dict[str, Any]:
         self._validate_type(type_)
         json_data = {
             "asset_id": asset_id,
@@ -293,8 +591,7 @@ class Client:
         if max_offer_discount is not None: json_data["max_offer_discount"] = max_offer_discount
         if reserve_price is not None: json_data["reserve_price"] = reserve_price
         if duration_days is not None: json_data["duration_days"] = duration_days
-
-        return await self._request(method="POST", parameters="/listings", json_data=json_data)
+        return json_data
 
     async def create_buy_order(self, *, market_hash_name: str, max_price: int, quantity: int) -> Optional[dict]:
         json_data = {"market_hash_name": market_hash_name, "max_price": max_price, "quantity": quantity}
@@ -302,11 +599,12 @@ class Client:
 
     async def make_offer(self, *, listing_id: int, price: int) -> Optional[dict]:
         json_data = {"contract_id": str(listing_id), "price": price, "cancel_previous_offer": False}
-        return await self._request(method="POST", parameters="/offers", json_data=json_data)
+        return await self._request(method="POST", parameters="/offers", json_data=json_data, priority=PRIORITY_HIGH)
 
     async def buy_now(self, *, total_price: int, listing_id: str) -> Optional[dict]:
         json_data = {"total_price": total_price, "contract_ids": [str(listing_id)]}
-        return await self._request(method="POST", parameters="/listings/buy", json_data=json_data)
+        return await self._request(method="POST", parameters="/listings/buy", json_data=json_data,
+                                   priority=PRIORITY_HIGH)
 
     async def accept_sale(self, *, trade_ids: List[str]):
         json_data = {"trade_ids": trade_ids}
@@ -314,4 +612,181 @@ class Client:
 
     async def update_listing_price(self, *, listing_id: int, price: int):
         json_data = {"price": price}
-        return await self._request(method="PATCH", parameters=f"/listings/{listing_id}", json_data=json_data)
\ No newline at end of file
+        return await self._request(method="PATCH", parameters=f"/listings/{listing_id}", json_data=json_data)
+
+    async def _stall_prices(self, user_id: Optional[int], limit: int) -> Dict[str, Optional[float]]:
+        """Maps both the listing id and the asset id of every listing in a stall to its price.
+
+        Follows the stall's cursor ``limit`` listings at a time and raises ``CSFloatError`` if
+        fewer listings came back than the stall reports, so a dry run never misses any.
+        """
+        if user_id is None:
+            me = await self.get_me()
+            user_id = me.user.steam_id
+        prices: Dict[str, Optional[float]] = {}
+        seen = 0
+        cursor = None
+        while True:
+            response = await self.get_stall(user_id, limit=limit, cursor=cursor, raw_response=True)
+            page = response.get("data") or [] if isinstance(response, dict) else response or []
+            for item in page:
+                listing = Listing.model_validate(item)
+                seen += 1
+                prices[str(listing.id)] = listing.price
+                if listing.item is not None and listing.item.asset_id is not None:
+                    prices[str(listing.item.asset_id)] = listing.price
+            next_cursor = response.get("cursor") if isinstance(response, dict) else None
+            if not page or not next_cursor or next_cursor == cursor:
+                break
+            cursor = next_cursor
+        total = response.get("total_count") if isinstance(response, dict) else None
+        if total is not None and seen < total:
+            raise CSFloatError(f"Stall of user {user_id} returned {seen} of {total} listings")
+        return prices
+
+    async def _write_many(
+            self,
+            keys: List[Any],
+            single: Callable[[Any], Awaitable[Any]],
+            *,
+            bulk: Optional[Callable[[List[Any]], Awaitable[Any]]] = None,
+            concurrency: int = 5,
+            chunk_size: int = 50
+    ) -> List[BatchResult]:
+        """Sends writes through a bulk endpoint in chunks, falling back to ``single`` calls under the write budget.
+
+        A 404 or 405 from the bulk endpoint switches the remaining keys to per-item calls. Bulk
+        results are all-or-nothing per chunk: the bulk endpoints do not report per-item outcomes,
+        so every key of a chunk gets the chunk's whole response, or its error.
+        """
+        results: List[BatchResult] = []
+        remaining = keys
+        if bulk is not None:
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                try:
+                    response = await bulk(chunk)
+                except (NotFound, MethodNotAllowed):
+                    remaining = keys[start:]
+                    break
+                except CSFloatError as exc:
+                    results.extend(BatchResult(key, error=exc) for key in chunk)
+                else:
+                    results.extend(BatchResult(key, response) for key in chunk)
+            else:
+                remaining = []
+
+        async for result in fan_out(single, remaining, concurrency=concurrency):
+            results.append(result)
+        return results
+
+    async def create_listings_many(
+            self,
+            listings: Iterable[Mapping[str, Any]],
+            *,
+            concurrency: int = 5,
+            use_bulk: bool = True,
+            chunk_size: int = 50,
+            dry_run: bool = False,
+            user_id: Optional[int] = None,
+            stall_limit: int = 1000
+    ) -> List[BatchResult]:
+        """Lists many assets. Each entry holds the keyword arguments of ``create_listing``.
+
+        Results are keyed by ``asset_id``; bulk chunks succeed or fail as a whole. With ``dry_run``
+        nothing is sent; each result's value is ``{"old_price", "new_price"}`` where ``old_price``
+        is set if the asset is already in the stall, read ``stall_limit`` listings per request.
+        """
+        payloads = {str(entry["asset_id"]): self._listing_payload(**entry) for entry in listings}
+        if dry_run:
+            current = await self._stall_prices(user_id, stall_limit)
+            return [
+                BatchResult(asset_id, {"old_price": current.get(asset_id),
+                                       "new_price": payload["price"]})
+                for asset_id, payload in payloads.items()
+            ]
+
+        async def single(asset_id: str) -> Optional[dict]:
+            return await self._request(method="POST", parameters="/listings", json_data=payloads[asset_id])
+
+        async def bulk(asset_ids: List[str]) -> Optional[dict]:
+            json_data = {"items": [payloads[asset_id] for asset_id in asset_ids]}
+            return await self._request(method="POST", parameters="/listings/bulk-list", json_data=json_data)
+
+        return await self._write_many(list(payloads), single, bulk=bulk if use_bulk else None,
+                                      concurrency=concurrency, chunk_size=chunk_size)
+
+    async def reprice_many(
+            self,
+            prices: Mapping[int, int],
+            *,
+            concurrency: int = 5,
+            use_bulk: bool = True,
+            chunk_size: int = 50,
+            dry_run: bool = False,
+            user_id: Optional[int] = None,
+            stall_limit: int = 1000
+    ) -> List[BatchResult]:
+        """Sets new prices given as ``{listing_id: price}``; bulk chunks succeed or fail as a whole.
+
+        With ``dry_run`` nothing is sent; the result lists only listings whose price would change,
+        with ``{"old_price", "new_price"}`` (``old_price`` is None for listings not in the stall).
+        """
+        new_prices = {str(listing_id): price for listing_id, price in prices.items()}
+        if dry_run:
+            current = await self._stall_prices(user_id, stall_limit)
+            return [
+                BatchResult(listing_id, {"old_price": current.get(listing_id), "new_price": price})
+                for listing_id, price in new_prices.items()
+                if current.get(listing_id) != price
+            ]
+
+        async def single(listing_id: str) -> Optional[dict]:
+            return await self.update_listing_price(listing_id=int(listing_id), price=new_prices[listing_id])
+
+        async def bulk(listing_ids: List[str]) -> Optional[dict]:
+            json_data = {"modifications": [
+                {"contract_id": listing_id, "price": new_prices[listing_id]} for listing_id in listing_ids
+            ]}
+            return await self._request(method="PATCH", parameters="/listings/bulk-modify", json_data=json_data)
+
+        return await self._write_many(list(new_prices), single, bulk=bulk if use_bulk else None,
+                                      concurrency=concurrency, chunk_size=chunk_size)
+
+    async def delete_listings_many(
+            self,
+            listing_ids: Iterable[int],
+            *,
+            concurrency: int = 5,
+            use_bulk: bool = True,
+            chunk_size: int = 50,
+            dry_run: bool = False,
+            user_id: Optional[int] = None,
+            stall_limit: int = 1000
+    ) -> List[BatchResult]:
+        """Delists many listings; bulk chunks succeed or fail as a whole.
+
+        With ``dry_run`` nothing is sent; each result's value is ``{"old_price", "new_price": None}``
+        (``old_price`` is None for listings not in the stall).
+        """
+        keys = list(dict.fromkeys(str(listing_id) for listing_id in listing_ids))
+        if dry_run:
+            current = await self._stall_prices(user_id, stall_limit)
+            return [
+                BatchResult(listing_id, {"old_price": current.get(listing_id), "new_price": None})
+                for listing_id in keys
+            ]
+
+        async def single(listing_id: str) -> Optional[dict]:
+            return await self.delete_listing(listing_id=int(listing_id))
+
+        async def bulk(chunk: List[str]) -> Optional[dict]:
+            return await self._request(method="PATCH", parameters="/listings/bulk-delist",
+                                       json_data={"contract_ids": chunk})
+
+        return await self._write_many(keys, single, bulk=bulk if use_bulk else None,
+                                      concurrency=concurrency, chunk_size=chunk_size)
+
+    async def delete_buy_orders_many(self, ids: Iterable[int], *, concurrency: int = 5) -> List[BatchResult]:
+        return await self._write_many(list(dict.fromkeys(ids)), lambda id: self.delete_buy_order(id=id),
+                                      concurrency=concurrency)
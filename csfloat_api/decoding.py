@@ -0,0 +1,120 @@
+import json
+import typing
+from types import NoneType, UnionType
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+__all__ = ("DECODE_MODES", "LazyModel", "decode", "json_dumps", "json_loads")
+
+DECODE_MODES = ("validate", "lazy")
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+M = TypeVar("M", bound=BaseModel)
+
+# (field name, key in the payload, nested model or None, is a list of the nested model)
+_FieldPlan = Tuple[str, str, Optional[Type[BaseModel]], bool]
+
+_plans: Dict[Type[BaseModel], Dict[str, _FieldPlan]] = {}
+_adapters: Dict[Tuple[Type[BaseModel], str], TypeAdapter] = {}
+_MISSING = object()
+
+
+def _unwrap(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    origin = typing.get_origin(annotation)
+    if origin is Union or origin is UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not NoneType]
+        if len(args) != 1:
+            return None, False
+        return _unwrap(args[0])
+    if origin in (list, List):
+        args = typing.get_args(annotation)
+        nested, _ = _unwrap(args[0]) if args else (None, False)
+        return nested, nested is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+def _plan(model: Type[BaseModel]) -> Dict[str, _FieldPlan]:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = {}
+        for name, field in model.model_fields.items():
+            nested, is_list = _unwrap(field.annotation)
+            plan[name] = (name, field.alias or name, nested, is_list)
+        _plans[model] = plan
+    return plan
+
+
+class LazyModel:
+    """Read-only view over a raw payload that validates each field on first access."""
+
+    __slots__ = ("_model", "_data", "_values")
+
+    def __init__(self, model: Type[BaseModel], data: Dict[str, Any]) -> None:
+        self._model = model
+        self._data = data
+        self._values: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Model fields never start with "_"; answering here keeps copy/pickle probes
+        # (``__setstate__`` on an instance without slots set) from recursing.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        field_plan = _plan(self._model).get(name)
+        if field_plan is None:
+            raise AttributeError(f"{self._model.__name__!r} object has no attribute {name!r}")
+        _, key, nested, is_list = field_plan
+
+        raw = self._data.get(key, self._data.get(name, _MISSING))
+        if raw is _MISSING:
+            value = self._model.model_fields[name].get_default(call_default_factory=True)
+        elif nested is not None and raw is not None:
+            value = [LazyModel(nested, item) for item in raw] if is_list else LazyModel(nested, raw)
+        else:
+            adapter = _adapters.get((self._model, name))
+            if adapter is None:
+                adapter = _adapters[(self._model, name)] = TypeAdapter(self._model.model_fields[name].annotation)
+            value = adapter.validate_python(raw)
+        self._values[name] = value
+        return value
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return LazyModel, (self._model, self._data)
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        return self._data
+
+    def model(self) -> BaseModel:
+        """Fully validates the payload into the underlying pydantic model."""
+        return self._model.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyModel({self._model.__name__}, id={self._data.get('id')!r})"
+
+
+def decode(model: Type[M], data: Dict[str, Any], mode: str = "validate") -> Union[M, LazyModel]:
+    if mode == "validate":
+        return model.model_validate(data)
+    if mode == "lazy":
+        return LazyModel(model, data)
+    raise ValueError(f'Unknown decode parameter "{mode}"')
@@ -0,0 +1,113 @@
+from typing import Any, Dict, Optional, Type
+
+__all__ = (
+    "CSFloatError",
+    "TransportError",
+    "InvalidResponse",
+    "CassetteMiss",
+    "HTTPError",
+    "Unauthorized",
+    "Forbidden",
+    "NotFound",
+    "MethodNotAllowed",
+    "NotAcceptable",
+    "Gone",
+    "ImATeapot",
+    "TooManyRequests",
+    "ServerError",
+    "InternalServerError",
+    "ServiceUnavailable",
+    "error_for_status",
+)
+
+
+class CSFloatError(Exception):
+    """Base class for every error raised by the client."""
+    retryable = False
+
+
+class TransportError(CSFloatError):
+    """The request did not complete: connection reset, timeout, proxy failure."""
+    retryable = True
+
+
+class InvalidResponse(CSFloatError):
+    """The server answered with something that is not valid JSON."""
+
+
+class CassetteMiss(CSFloatError):
+    """A replayed request has no recorded response in the cassette."""
+
+
+class HTTPError(CSFloatError):
+    status = 0
+
+    def __init__(self, message: str, *, status: Optional[int] = None, body: Any = None,
+                 retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        if status is not None:
+            self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+class Unauthorized(HTTPError):
+    status = 401
+
+
+class Forbidden(HTTPError):
+    status = 403
+
+
+class NotFound(HTTPError):
+    status = 404
+
+
+class MethodNotAllowed(HTTPError):
+    status = 405
+
+
+class NotAcceptable(HTTPError):
+    status = 406
+
+
+class Gone(HTTPError):
+    status = 410
+
+
+class ImATeapot(HTTPError):
+    status = 418
+
+
+class TooManyRequests(HTTPError):
+    status = 429
+    retryable = True
+
+
+class ServerError(HTTPError):
+    status = 500
+    retryable = True
+
+
+class InternalServerError(ServerError):
+    status = 500
+
+
+class ServiceUnavailable(ServerError):
+    status = 503
+
+
+_STATUS_ERRORS: Dict[int, Type[HTTPError]] = {
+    cls.status: cls for cls in (
+        Unauthorized, Forbidden, NotFound, MethodNotAllowed, NotAcceptable, Gone, ImATeapot,
+        TooManyRequests, InternalServerError, ServiceUnavailable,
+    )
+}
+
+
+def error_for_status(status: int, message: str, *, body: Any = None,
+                     retry_after: Optional[float] = None) -> HTTPError:
+    cls = _STATUS_ERRORS.get(status)
+    if cls is None:
+        cls = ServerError if status >= 500 else HTTPError
+    return cls(message, status=status, body=body, retry_after=retry_after)
@@ -0,0 +1,164 @@
+import bisect
+from array import array
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ._fields import get_field
+
+__all__ = ("FloatIndex",)
+
+SkinKey = Tuple[int, int]
+
+
+class _Skin:
+    __slots__ = ("floats", "ids", "seeds")
+
+    def __init__(self) -> None:
+        # Parallel arrays sorted by float value.
+        self.floats = array("d")
+        self.ids = array("q")
+        self.seeds: Dict[int, Set[int]] = {}
+
+
+class FloatIndex:
+    """In-memory index of listings per skin, keyed by ``(def_index, paint_index)``.
+
+    Each skin keeps its float values in a sorted array and its listings bucketed by
+    ``paint_seed``, so rank queries are a binary search and seed lookups a dict probe.
+    Listings can be fed one by one, in batches or from ``Client.iter_listings``; adding a
+    listing id again replaces the previous entry.
+    """
+
+    __slots__ = ("_skins", "_entries")
+
+    def __init__(self) -> None:
+        self._skins: Dict[SkinKey, _Skin] = {}
+        # listing id -> (skin key, float value, paint seed)
+        self._entries: Dict[int, Tuple[SkinKey, Optional[float], Optional[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, listing_id: int) -> bool:
+        return listing_id in self._entries
+
+    def skins(self) -> List[SkinKey]:
+        return list(self._skins)
+
+    def add(self, listing: Any) -> bool:
+        """Indexes a ``Listing``, ``LazyModel`` or raw payload; returns False if it has no skin."""
+        item = get_field(listing, "item")
+        listing_id, def_index, paint_index = get_field(listing, "id"), get_field(item, "def_index"), get_field(item, "paint_index")
+        if listing_id is None or def_index is None or paint_index is None:
+            return False
+        key = (def_index, paint_index)
+        float_value, paint_seed = get_field(item, "float_value"), get_field(item, "paint_seed")
+        previous = self._entries.get(listing_id)
+        if previous is not None:
+            if previous == (key, float_value, paint_seed):
+                return True
+            self.remove(listing_id)
+
+        skin = self._skins.get(key)
+        if skin is None:
+            skin = self._skins[key] = _Skin()
+        if float_value is not None:
+            position = bisect.bisect_right(skin.floats, float_value)
+            skin.floats.insert(position, float_value)
+            skin.ids.insert(position, listing_id)
+        if paint_seed is not None:
+            skin.seeds.setdefault(paint_seed, set()).add(listing_id)
+        self._entries[listing_id] = (key, float_value, paint_seed)
+        return True
+
+    def extend(self, listings: Iterable[Any]) -> None:
+        for listing in listings:
+            self.add(listing)
+
+    async def consume(self, listings: AsyncIterable[Any]) -> int:
+        """Indexes a listing stream; returns the number of listings indexed."""
+        indexed = 0
+        async for listing in listings:
+            indexed += self.add(listing)
+        return indexed
+
+    def remove(self, listing_id: int) -> bool:
+        entry = self._entries.pop(listing_id, None)
+        if entry is None:
+            return False
+        key, float_value, paint_seed = entry
+        skin = self._skins[key]
+        if float_value is not None:
+            position = bisect.bisect_left(skin.floats, float_value)
+            while skin.ids[position] != listing_id:
+                position += 1
+            del skin.floats[position]
+            del skin.ids[position]
+        if paint_seed is not None:
+            bucket = skin.seeds[paint_seed]
+            bucket.discard(listing_id)
+            if not bucket:
+                del skin.seeds[paint_seed]
+        if not skin.floats and not skin.seeds:
+            del self._skins[key]
+        return True
+
+    def rank(self, def_index: int, paint_index: int, float_value: float) -> int:
+        """Number of indexed listings of the skin with a strictly lower float (0 = lowest)."""
+        skin = self._skins.get((def_index, paint_index))
+        return bisect.bisect_left(skin.floats, float_value) if skin is not None else 0
+
+    def high_rank(self, def_index: int, paint_index: int, float_value: float) -> int:
+        """Number of indexed listings of the skin with a strictly higher float (0 = highest)."""
+        skin = self._skins.get((def_index, paint_index))
+        return len(skin.floats) - bisect.bisect_right(skin.floats, float_value) if skin is not None else 0
+
+    def is_top(self, def_index: int, paint_index: int, float_value: float, n: int = 10) -> bool:
+        """Whether ``float_value`` would be among the ``n`` lowest floats seen for the skin."""
+        return self.rank(def_index, paint_index, float_value) < n
+
+    def rank_of(self, listing: Any) -> Optional[int]:
+        """``rank`` of a listing's own float, or None when it has no skin or float."""
+        item = get_field(listing, "item")
+        def_index, paint_index, float_value = (get_field(item, "def_index"), get_field(item, "paint_index"),
+                                               get_field(item, "float_value"))
+        if def_index is None or paint_index is None or float_value is None:
+            return None
+        return self.rank(def_index, paint_index, float_value)
+
+    def lowest(self, def_index: int, paint_index: int, n: int = 10) -> List[Tuple[float, int]]:
+        """``(float_value, listing_id)`` of the ``n`` lowest floats of the skin."""
+        skin = self._skins.get((def_index, paint_index))
+        if skin is None:
+            return []
+        return list(zip(skin.floats[:n], skin.ids[:n]))
+
+    def highest(self, def_index: int, paint_index: int, n: int = 10) -> List[Tuple[float, int]]:
+        skin = self._skins.get((def_index, paint_index))
+        if skin is None or n <= 0:
+            return []
+        return list(zip(reversed(skin.floats[-n:]), reversed(skin.ids[-n:])))
+
+    def between(self, def_index: int, paint_index: int, min_float: float, max_float: float) -> List[int]:
+        """Listing ids of the skin with ``min_float <= float_value <= max_float``, lowest float first."""
+        skin = self._skins.get((def_index, paint_index))
+        if skin is None:
+            return []
+        start = bisect.bisect_left(skin.floats, min_float)
+        return list(skin.ids[start:bisect.bisect_right(skin.floats, max_float, start)])
+
+    def find_seeds(self, def_index: int, paint_index: int, seeds: Iterable[int]) -> Dict[int, Set[int]]:
+        """Listing ids of the skin for each requested seed that is present."""
+        skin = self._skins.get((def_index, paint_index))
+        if skin is None:
+            return {}
+        buckets = skin.seeds
+        return {seed: set(buckets[seed]) for seed in seeds if seed in buckets}
+
+    def find_seeds_many(self, queries: Iterable[Tuple[int, int, Iterable[int]]]) -> Dict[SkinKey, Dict[int, Set[int]]]:
+        """Runs ``find_seeds`` for many ``(def_index, paint_index, seeds)`` queries at once."""
+        found = {}
+        for def_index, paint_index, seeds in queries:
+            matches = self.find_seeds(def_index, paint_index, seeds)
+            if matches:
+                found.setdefault((def_index, paint_index), {}).update(matches)
+        return found
@@ -0,0 +1,224 @@
+import math
+from array import array
+from typing import Any, AsyncIterable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from ._fields import NAN, NO_INT, as_float, as_int, as_timestamp, get_field
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None
+
+__all__ = ("ListingFrame",)
+
+# Column name -> array typecode. ``market_hash_name`` holds indices into ``ListingFrame.names``.
+_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    ("id", "q"),
+    ("price", "d"),
+    ("float_value", "d"),
+    ("paint_seed", "q"),
+    ("def_index", "q"),
+    ("paint_index", "q"),
+    ("predicted_price", "d"),
+    ("created_at", "d"),
+    ("market_hash_name", "q"),
+)
+_DTYPES = {"q": "int64", "d": "float64"}
+
+
+
+class ListingFrame:
+    """Column-oriented snapshot of listings backed by typed arrays.
+
+    Hot fields are stored one array per column (8 bytes per value) and market hash names
+    are interned, so millions of listings fit in memory. Filters and sorts are vectorized
+    with NumPy when it is installed and fall back to plain Python otherwise.
+    """
+
+    __slots__ = ("_columns", "names", "_codes")
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, array] = {name: array(typecode) for name, typecode in _SCHEMA}
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    @classmethod
+    def from_listings(cls, listings: Iterable[Any]) -> "ListingFrame":
+        frame = cls()
+        frame.extend(listings)
+        return frame
+
+    @classmethod
+    async def from_stream(cls, listings: AsyncIterable[Any]) -> "ListingFrame":
+        """Builds a frame from ``Client.iter_listings`` without keeping the listings around."""
+        frame = cls()
+        async for listing in listings:
+            frame.append(listing)
+        return frame
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def _intern(self, name: Optional[str]) -> int:
+        if name is None:
+            return NO_INT
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def append(self, listing: Any) -> None:
+        """Adds a ``Listing``, a ``LazyModel`` of one, or a raw listing payload dict."""
+        item = get_field(listing, "item")
+        columns = self._columns
+        columns["id"].append(as_int(get_field(listing, "id")))
+        columns["price"].append(as_float(get_field(listing, "price")))
+        columns["created_at"].append(as_timestamp(get_field(listing, "created_at")))
+        columns["predicted_price"].append(as_float(get_field(get_field(listing, "reference"), "predicted_price")))
+        columns["float_value"].append(as_float(get_field(item, "float_value")))
+        columns["paint_seed"].append(as_int(get_field(item, "paint_seed")))
+        columns["def_index"].append(as_int(get_field(item, "def_index")))
+        columns["paint_index"].append(as_int(get_field(item, "paint_index")))
+        columns["market_hash_name"].append(self._intern(get_field(item, "market_hash_name")))
+
+    def extend(self, listings: Iterable[Any]) -> None:
+        for listing in listings:
+            self.append(listing)
+
+    def _view(self, name: str) -> Any:
+        values = self._columns[name]
+        if np is None:
+            return values
+        if not values:
+            return np.empty(0, dtype=_DTYPES[values.typecode])
+        return np.frombuffer(values, dtype=_DTYPES[values.typecode])
+
+    def column(self, name: str) -> Any:
+        """Returns a copy of a column as a NumPy array, or an ``array.array`` without NumPy."""
+        if name not in self._columns:
+            raise KeyError(f'Unknown column "{name}"')
+        values = self._view(name)
+        return values.copy() if np is not None else array(values.typecode, values)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        row = {name: self._columns[name][index] for name, _ in _SCHEMA}
+        code = row["market_hash_name"]
+        row["market_hash_name"] = self.names[code] if code != NO_INT else None
+        return row
+
+    def take(self, indices: Union[Sequence[int], Any]) -> "ListingFrame":
+        """Returns a new frame with the given rows, in the given order. The name table is shared."""
+        frame = ListingFrame.__new__(ListingFrame)
+        frame.names = self.names
+        frame._codes = self._codes
+        if np is not None:
+            indices = np.asarray(indices, dtype="int64")
+            frame._columns = {
+                name: array(typecode, np.take(self._view(name), indices).tobytes()) for name, typecode in _SCHEMA
+            }
+        else:
+            frame._columns = {
+                name: array(typecode, [self._columns[name][i] for i in indices]) for name, typecode in _SCHEMA
+            }
+        return frame
+
+    def head(self, count: int) -> "ListingFrame":
+        return self.take(range(min(count, len(self))))
+
+    def filter(
+            self,
+            *,
+            min_price: Optional[float] = None,
+            max_price: Optional[float] = None,
+            min_float: Optional[float] = None,
+            max_float: Optional[float] = None,
+            market_hash_name: Optional[Union[str, Iterable[str]]] = None,
+            def_index: Optional[int] = None,
+            paint_index: Optional[int] = None,
+            paint_seeds: Optional[Iterable[int]] = None,
+            max_price_ratio: Optional[float] = None
+    ) -> "ListingFrame":
+        """Selects rows matching every given condition.
+
+        ``max_price_ratio`` keeps listings priced at most that fraction of ``predicted_price``.
+        Rows with a missing value never match a condition on that column.
+        """
+        conditions: List[Tuple[str, str, Any]] = []
+        if min_price is not None: conditions.append(("price", "ge", min_price))
+        if max_price is not None: conditions.append(("price", "le", max_price))
+        if min_float is not None: conditions.append(("float_value", "ge", min_float))
+        if max_float is not None: conditions.append(("float_value", "le", max_float))
+        if def_index is not None: conditions.append(("def_index", "eq", def_index))
+        if paint_index is not None: conditions.append(("paint_index", "eq", paint_index))
+        if paint_seeds is not None: conditions.append(("paint_seed", "in", set(paint_seeds)))
+        if market_hash_name is not None:
+            names = [market_hash_name] if isinstance(market_hash_name, str) else market_hash_name
+            codes = {self._codes[name] for name in names if name in self._codes}
+            conditions.append(("market_hash_name", "in", codes))
+        return self.take(self._select(conditions, max_price_ratio))
+
+    def _select(self, conditions: List[Tuple[str, str, Any]], max_price_ratio: Optional[float]) -> Any:
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for name, op, value in conditions:
+                column = self._view(name)
+                if op == "ge":
+                    mask &= column >= value
+                elif op == "le":
+                    mask &= column <= value
+                elif op == "eq":
+                    mask &= column == value
+                else:
+                    mask &= np.isin(column, np.fromiter(value, dtype="int64", count=len(value)))
+            if max_price_ratio is not None:
+                mask &= self._view("price") <= self._view("predicted_price") * max_price_ratio
+            return np.flatnonzero(mask)
+
+        indices: Iterable[int] = range(len(self))
+        for name, op, value in conditions:
+            column = self._columns[name]
+            if op == "ge":
+                indices = [i for i in indices if column[i] >= value]
+            elif op == "le":
+                indices = [i for i in indices if column[i] <= value]
+            elif op == "eq":
+                indices = [i for i in indices if column[i] == value]
+            else:
+                indices = [i for i in indices if column[i] in value]
+        if max_price_ratio is not None:
+            price, predicted = self._columns["price"], self._columns["predicted_price"]
+            indices = [i for i in indices if price[i] <= predicted[i] * max_price_ratio]
+        return list(indices)
+
+    def sort_by(self, name: str, *, descending: bool = False) -> "ListingFrame":
+        """Returns a sorted copy. Missing float values sort last in either direction."""
+        if name not in self._columns:
+            raise KeyError(f'Unknown column "{name}"')
+        if np is not None:
+            column = self._view(name)
+            order = np.argsort(-column if descending else column, kind="stable")
+            return self.take(order)
+
+        column = self._columns[name]
+        sign = -1 if descending else 1
+
+        def key(index: int) -> Tuple[bool, float]:
+            value = column[index]
+            return math.isnan(value), 0 if math.isnan(value) else sign * value
+
+        return self.take(sorted(range(len(self)), key=key))
+
+    def discount(self) -> Any:
+        """Fraction below ``predicted_price`` for each row (NaN when there is no reference)."""
+        if np is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return 1 - self._view("price") / self._view("predicted_price")
+        price, predicted = self._columns["price"], self._columns["predicted_price"]
+        return array("d", (
+            1 - p / r if r and not math.isnan(r) else NAN for p, r in zip(price, predicted)
+        ))
@@ -0,0 +1,307 @@
+import bisect
+import re
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+__all__ = (
+    "RequestInfo",
+    "Hooks",
+    "Histogram",
+    "MetricsCollector",
+    "OpenTelemetryHooks",
+    "endpoint_name",
+    "build_trace_config",
+)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_HISTORY_SEGMENT = re.compile(r"^/history/[^/]+")
+
+# "validate" is the model decoding done by the getters after the request; it is not part of "total".
+PHASES = ("wait", "dns", "connect", "ttfb", "body", "decode", "total", "validate")
+
+
+def endpoint_name(parameters: str) -> str:
+    """Collapses a request path into a low-cardinality label, e.g. ``/listings/{id}``."""
+    path = parameters.split("?", 1)[0]
+    path = _HISTORY_SEGMENT.sub("/history/{market_hash_name}", path)
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+class RequestInfo:
+    """Everything measured about one attempt of a request. Timings are in seconds."""
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "attempt",
+        "status",
+        "error",
+        "bytes_received",
+        "reused_connection",
+        "timings",
+        "_started",
+        "_marks",
+    )
+
+    def __init__(self, method: str, parameters: str, attempt: int = 1) -> None:
+        self.method = method
+        self.endpoint = endpoint_name(parameters)
+        self.attempt = attempt
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.bytes_received = 0
+        self.reused_connection = False
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._marks: Dict[str, float] = {}
+
+    def mark(self, name: str) -> None:
+        self._marks[name] = time.perf_counter()
+
+    def measure(self, phase: str, since: str) -> None:
+        started = self._marks.get(since)
+        if started is not None:
+            self.timings[phase] = time.perf_counter() - started
+
+    def finish(self) -> None:
+        self.timings["total"] = time.perf_counter() - self._started
+
+
+class Hooks:
+    """Callbacks invoked by ``Client`` around every request attempt. Override what you need."""
+
+    def on_request_start(self, info: RequestInfo) -> None:
+        pass
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        pass
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        pass
+
+    def on_rate_limited(self, info: RequestInfo, retry_after: Optional[float]) -> None:
+        pass
+
+    def on_validate(self, method: str, endpoint: str, seconds: float) -> None:
+        """Called after a getter turned a response into models, with the time that took."""
+        pass
+
+
+async def _on_request_start(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.mark("request")
+
+
+async def _on_dns_start(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.mark("dns")
+
+
+async def _on_dns_end(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.measure("dns", "dns")
+
+
+async def _on_connection_create_start(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.mark("connect")
+
+
+async def _on_connection_create_end(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.measure("connect", "connect")
+
+
+async def _on_connection_reuse(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.reused_connection = True
+
+
+async def _on_request_end(session, context, params) -> None:
+    if isinstance(context.trace_request_ctx, RequestInfo):
+        context.trace_request_ctx.measure("ttfb", "request")
+
+
+def build_trace_config() -> aiohttp.TraceConfig:
+    """aiohttp tracing that fills the ``RequestInfo`` passed as ``trace_request_ctx``."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuse)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
+
+
+class Histogram:
+    """Fixed-bucket latency histogram in the Prometheus style."""
+
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return float("nan")
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return float("inf")
+
+
+class _EndpointStats:
+    __slots__ = ("requests", "errors", "retries", "rate_limited", "bytes_received", "reused_connections",
+                 "statuses", "phases")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.bytes_received = 0
+        self.reused_connections = 0
+        self.statuses: Dict[int, int] = {}
+        self.phases = {phase: Histogram() for phase in PHASES}
+
+
+class MetricsCollector(Hooks):
+    """Per-endpoint counters and per-phase latency histograms."""
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[Tuple[str, str], _EndpointStats] = {}
+
+    def _stats(self, info: RequestInfo) -> _EndpointStats:
+        return self._endpoint(info.method, info.endpoint)
+
+    def _endpoint(self, method: str, endpoint: str) -> _EndpointStats:
+        key = (method, endpoint)
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = self.endpoints[key] = _EndpointStats()
+        return stats
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        stats = self._stats(info)
+        stats.requests += 1
+        if info.error is not None:
+            stats.errors += 1
+        if info.status is not None:
+            stats.statuses[info.status] = stats.statuses.get(info.status, 0) + 1
+        stats.bytes_received += info.bytes_received
+        stats.reused_connections += info.reused_connection
+        for phase, value in info.timings.items():
+            stats.phases[phase].observe(value)
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        self._stats(info).retries += 1
+
+    def on_rate_limited(self, info: RequestInfo, retry_after: Optional[float]) -> None:
+        self._stats(info).rate_limited += 1
+
+    def on_validate(self, method: str, endpoint: str, seconds: float) -> None:
+        self._endpoint(method, endpoint).phases["validate"].observe(seconds)
+
+    def reset(self) -> None:
+        self.endpoints.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        rows = []
+        for (method, endpoint), stats in sorted(self.endpoints.items()):
+            rows.append({
+                "method": method,
+                "endpoint": endpoint,
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "retries": stats.retries,
+                "rate_limited": stats.rate_limited,
+                "bytes_received": stats.bytes_received,
+                "reused_connections": stats.reused_connections,
+                "statuses": dict(stats.statuses),
+                "latency": {
+                    phase: {"count": histogram.count, "mean": histogram.sum / histogram.count,
+                            "p50": histogram.quantile(0.5), "p99": histogram.quantile(0.99)}
+                    for phase, histogram in stats.phases.items() if histogram.count
+                },
+            })
+        return rows
+
+    def to_prometheus(self, prefix: str = "csfloat") -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        endpoints = sorted(self.endpoints.items())
+        lines = []
+        for counter, attribute in (
+                ("requests_total", "requests"),
+                ("errors_total", "errors"),
+                ("retries_total", "retries"),
+                ("rate_limited_total", "rate_limited"),
+                ("received_bytes_total", "bytes_received"),
+        ):
+            lines.append(f"# TYPE {prefix}_{counter} counter")
+            for (method, endpoint), stats in endpoints:
+                lines.append(f'{prefix}_{counter}{{method="{method}",endpoint="{endpoint}"}} '
+                             f'{getattr(stats, attribute)}')
+
+        name = f"{prefix}_request_phase_seconds"
+        lines.append(f"# TYPE {name} histogram")
+        for (method, endpoint), stats in endpoints:
+            for phase, histogram in stats.phases.items():
+                if not histogram.count:
+                    continue
+                labels = f'method="{method}",endpoint="{endpoint}",phase="{phase}"'
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHooks(Hooks):
+    """Forwards request metrics to an OpenTelemetry ``Meter`` supplied by the caller."""
+
+    def __init__(self, meter: Any) -> None:
+        self._requests = meter.create_counter("csfloat.requests", description="Request attempts")
+        self._retries = meter.create_counter("csfloat.retries", description="Retried request attempts")
+        self._rate_limited = meter.create_counter("csfloat.rate_limited", description="429 responses")
+        self._durations = meter.create_histogram("csfloat.request.phase.duration", unit="s",
+                                                 description="Request phase durations")
+
+    @staticmethod
+    def _attributes(info: RequestInfo) -> Dict[str, Any]:
+        return {"http.method": info.method, "endpoint": info.endpoint, "http.status_code": info.status or 0}
+
+    def on_request_end(self, info: RequestInfo) -> None:
+        attributes = self._attributes(info)
+        self._requests.add(1, attributes)
+        for phase, value in info.timings.items():
+            self._durations.record(value, {**attributes, "phase": phase})
+
+    def on_retry(self, info: RequestInfo, delay: float) -> None:
+        self._retries.add(1, self._attributes(info))
+
+    def on_rate_limited(self, info: RequestInfo, retry_after: Optional[float]) -> None:
+        self._rate_limited.add(1, self._attributes(info))
+
+    def on_validate(self, method: str, endpoint: str, seconds: float) -> None:
+        self._durations.record(seconds, {"http.method": method, "endpoint": endpoint, "phase": "validate"})
@@ -0,0 +1,4 @@
+from .listing import Listing
+
+class Sale(Listing):
+    pass
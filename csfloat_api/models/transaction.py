@@ -0,0 +1,12 @@
+from typing import Optional, Any, Union
+from pydantic import BaseModel
+from datetime import datetime
+
+class Transaction(BaseModel):
+    id: Optional[Union[int, str]] = None
+    created_at: Optional[datetime] = None
+    type: Optional[str] = None
+    balance_offset: Optional[int] = None
+    pending_offset: Optional[int] = None
+    fee: Optional[int] = None
+    details: Optional[Any] = None
@@ -0,0 +1,202 @@
+import asyncio
+import inspect
+import time
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Tuple, Union
+
+from .batch import BatchResult
+from .csfloat_client import Client
+from .exceptions import CSFloatError, ServerError, TransportError
+
+__all__ = ("ClientPool", "PoolMember")
+
+# Public ``Client`` methods that are not tied to an account and may run on any member,
+# mapped to the rate budget that limits them.
+_SHARED_METHODS = {
+    "get_exchange_rates": "default",
+    "get_location": "default",
+    "get_sales": "default",
+    "get_sales_many": "default",
+    "get_similar": "listings",
+    "get_similar_many": "listings",
+    "get_buy_orders": "listings",
+    "get_buy_orders_many": "listings",
+    "get_all_listings": "listings",
+    "iter_listings": "listings",
+    "get_specific_listing": "listings",
+    "get_listings_many": "listings",
+    "get_stall": "default",
+    "get_stalls_many": "default",
+}
+
+
+class PoolMember:
+    __slots__ = ("client", "in_flight", "failures", "ejected_until", "requests")
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.in_flight = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+    def load(self, budget: str) -> Tuple[int, float]:
+        bucket = self.client.rate_limiter.bucket(budget)
+        return self.in_flight + bucket.pending, -bucket.tokens
+
+    def __repr__(self) -> str:
+        return (f"PoolMember(proxy={self.client.proxy!r}, in_flight={self.in_flight}, "
+                f"failures={self.failures}, healthy={self.healthy})")
+
+
+class ClientPool:
+    """Spreads requests over several ``Client`` sessions, one per proxy and/or API key.
+
+    Exposes the same methods as ``Client``. Market reads go to the least-loaded healthy
+    member, judged by in-flight calls and its remaining rate budget. Account-bound calls
+    (``/me``, trades, offers, listing and buy-order writes) only run on members that use
+    the pool's ``api_key``. A member is ejected for ``eject_seconds`` after ``max_failures``
+    consecutive connection or server errors and is retried once that period is over.
+    """
+
+    def __init__(
+            self,
+            api_key: str,
+            proxies: Iterable[Union[Optional[str], Tuple[Optional[str], str]]] = (None,),
+            *,
+            max_failures: int = 3,
+            eject_seconds: float = 30.0,
+            **client_options: Any
+    ) -> None:
+        clients = []
+        for entry in proxies:
+            proxy, member_key = entry if isinstance(entry, tuple) else (entry, api_key)
+            clients.append(Client(member_key, proxy, **client_options))
+        self._setup(api_key, clients, max_failures, eject_seconds)
+
+    @classmethod
+    def from_clients(cls, api_key: str, clients: Iterable[Client], *, max_failures: int = 3,
+                     eject_seconds: float = 30.0) -> "ClientPool":
+        pool = cls.__new__(cls)
+        pool._setup(api_key, list(clients), max_failures, eject_seconds)
+        return pool
+
+    def _setup(self, api_key: str, clients: List[Client], max_failures: int, eject_seconds: float) -> None:
+        if not clients:
+            raise ValueError("ClientPool needs at least one client")
+        self.api_key = api_key
+        self.max_failures = max_failures
+        self.eject_seconds = eject_seconds
+        self.members = [PoolMember(client) for client in clients]
+        if not any(client.API_KEY == api_key for client in clients):
+            raise ValueError("ClientPool needs at least one client using the account api_key")
+
+    async def __aenter__(self) -> "ClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(member.client.close() for member in self.members))
+
+    def _pick(self, method_name: str) -> PoolMember:
+        budget = _SHARED_METHODS.get(method_name)
+        if budget is None:
+            candidates = [member for member in self.members if member.client.API_KEY == self.api_key]
+            budget = "write"
+        else:
+            candidates = self.members
+        healthy = [member for member in candidates if member.healthy]
+        if not healthy:
+            # Everything is ejected: prefer the member that has been out the longest.
+            return min(candidates, key=lambda member: member.ejected_until)
+        return min(healthy, key=lambda member: member.load(budget))
+
+    def _record(self, member: PoolMember, error: Optional[BaseException]) -> None:
+        if error is None:
+            member.failures = 0
+            return
+        if isinstance(error, (TransportError, ServerError)):
+            member.failures += 1
+            if member.failures >= self.max_failures:
+                member.ejected_until = time.monotonic() + self.eject_seconds
+
+    async def _track(self, member: PoolMember, name: str, iterator: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Counts a streaming helper against ``member`` while it is consumed.
+
+        The stream is in flight until it ends. Each ``BatchResult`` of a ``*_many`` helper
+        counts as a request and its error as a failure; other streams count once.
+        """
+        member.in_flight += 1
+        if not name.endswith("_many"):
+            member.requests += 1
+        try:
+            async for item in iterator:
+                if isinstance(item, BatchResult):
+                    member.requests += 1
+                    self._record(member, item.error)
+                yield item
+        except Exception as exc:
+            self._record(member, exc)
+            raise
+        else:
+            if not name.endswith("_many"):
+                self._record(member, None)
+        finally:
+            member.in_flight -= 1
+            close = getattr(iterator, "aclose", None)
+            if close is not None:
+                await close()
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        attribute = getattr(Client, name, None)
+        if name.startswith("_") or not callable(attribute):
+            raise AttributeError(f"'ClientPool' object has no attribute '{name}'")
+
+        if not inspect.iscoroutinefunction(attribute):
+            # Streaming helpers (iter_listings, *_many) stay on the member they start on.
+            def stream(*args: Any, **kwargs: Any) -> Any:
+                member = self._pick(name)
+                return self._track(member, name, getattr(member.client, name)(*args, **kwargs))
+            return stream
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            member = self._pick(name)
+            member.in_flight += 1
+            member.requests += 1
+            try:
+                result = await getattr(member.client, name)(*args, **kwargs)
+            except Exception as exc:
+                self._record(member, exc)
+                raise
+            finally:
+                member.in_flight -= 1
+            self._record(member, None)
+            return result
+
+        return call
+
+    def __dir__(self) -> Iterable[str]:
+        return sorted(set(super().__dir__()) | {name for name in dir(Client) if not name.startswith("_")})
+
+    async def health_check(self) -> List[PoolMember]:
+        """Probes every member and returns the healthy ones; unreachable members are ejected."""
+        async def probe(member: PoolMember) -> None:
+            try:
+                await member.client._request("GET", "/meta/location")
+            except (TransportError, ServerError):
+                member.failures = max(member.failures + 1, self.max_failures)
+                member.ejected_until = time.monotonic() + self.eject_seconds
+                return
+            except CSFloatError:
+                # Any other API answer still proves the route through this member works.
+                pass
+            member.failures = 0
+            member.ejected_until = 0.0
+
+        await asyncio.gather(*(probe(member) for member in self.members))
+        return [member for member in self.members if member.healthy]
@@ -0,0 +1,214 @@
+import asyncio
+import heapq
+import itertools
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Mapping, Optional, Tuple
+
+__all__ = (
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
+    "TokenBucket",
+    "RateLimiter",
+    "parse_retry_after",
+)
+
+# Lower value is served first.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Returns the number of seconds the server asked us to wait, if any."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                pass
+
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        try:
+            if int(remaining) > 0:
+                return None
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Either a unix timestamp or a number of seconds until the window resets.
+        if reset_value > 1e9:
+            reset_value -= time.time()
+        return max(reset_value, 0.0)
+    return None
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts with AIMD and whose waiters are served by priority.
+
+    While the bucket is what holds requests back, successful responses raise the rate by
+    ``increase`` per second. A burst of 429s from requests that were already in flight counts as
+    one congestion event: the rate is cut at most once per window of one refill interval (or
+    ``Retry-After``, if longer).
+    """
+
+    __slots__ = (
+        "rate",
+        "capacity",
+        "min_rate",
+        "max_rate",
+        "increase",
+        "decrease",
+        "_tokens",
+        "_updated",
+        "_blocked_until",
+        "_calm_until",
+        "_grown_at",
+        "_waiters",
+        "_counter",
+        "_dispatcher",
+    )
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: Optional[float] = None,
+            *,
+            min_rate: Optional[float] = None,
+            max_rate: Optional[float] = None,
+            increase: Optional[float] = None,
+            decrease: float = 0.5
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.max_rate = max_rate if max_rate is not None else rate * 4
+        self.increase = increase if increase is not None else rate / 20
+        self.decrease = decrease
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._calm_until = 0.0
+        self._grown_at = self._updated
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def pending(self) -> int:
+        return len(self._waiters)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and now >= self._blocked_until and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            if self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+                continue
+            now = time.monotonic()
+            self._refill(now)
+            delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            self._tokens -= 1
+            future.set_result(None)
+
+    def on_success(self) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        # Only grow while callers are actually waiting on the bucket, and by elapsed time
+        # rather than per response, so the increase stays additive at any request rate.
+        if self._waiters or self._tokens < 1:
+            self.rate = min(self.max_rate, self.rate + self.increase * min(now - self._grown_at, 1.0))
+        self._grown_at = now
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        if now >= self._calm_until:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._calm_until = now + max(1 / self.rate, retry_after or 0.0)
+        self._tokens = 0.0
+        self._updated = now
+        if retry_after:
+            self.block(retry_after)
+
+    def block(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Per-endpoint-class rate budgets shared by every request of a ``Client``."""
+
+    DEFAULT_BUDGETS = {
+        "listings": {"rate": 10.0, "max_rate": 50.0},
+        "me": {"rate": 5.0, "max_rate": 20.0},
+        "write": {"rate": 5.0, "max_rate": 20.0},
+        "default": {"rate": 5.0, "max_rate": 20.0},
+    }
+
+    __slots__ = ("buckets",)
+
+    def __init__(self, buckets: Optional[Dict[str, TokenBucket]] = None) -> None:
+        self.buckets = {name: TokenBucket(**budget) for name, budget in self.DEFAULT_BUDGETS.items()}
+        if buckets:
+            self.buckets.update(buckets)
+
+    @staticmethod
+    def classify(method: str, parameters: str) -> str:
+        if method != "GET":
+            return "write"
+        if parameters == "/me" or parameters.startswith(("/me/", "/me?")):
+            return "me"
+        if parameters.startswith("/listings"):
+            return "listings"
+        return "default"
+
+    def bucket(self, name: str) -> TokenBucket:
+        return self.buckets.get(name) or self.buckets["default"]
+
+    async def acquire(self, name: str, priority: int = PRIORITY_NORMAL) -> None:
+        await self.bucket(name).acquire(priority)
+
+    def feedback(self, name: str, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Adjusts the bucket after a response and returns the server-requested delay, if any."""
+        bucket = self.bucket(name)
+        retry_after = parse_retry_after(headers)
+        if status == 429:
+            bucket.on_throttled(retry_after)
+            return retry_after
+        if 200 <= status < 300:
+            bucket.on_success()
+        if retry_after:
+            bucket.block(retry_after)
+        return retry_after
@@ -0,0 +1,32 @@
+import random
+from typing import Iterable, Optional
+
+__all__ = ("RetryPolicy",)
+
+
+class RetryPolicy:
+    """Jittered exponential backoff applied to retryable errors of idempotent requests only."""
+
+    __slots__ = ("max_attempts", "base_delay", "max_delay", "methods")
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 30.0,
+                 methods: Iterable[str] = ("GET", "DELETE")) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.methods = frozenset(methods)
+
+    def should_retry(self, method: str, error: Exception, attempt: int) -> bool:
+        return (
+            attempt < self.max_attempts
+            and method in self.methods
+            and getattr(error, "retryable", False)
+        )
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            return max(retry_after, backoff)
+        return backoff
@@ -0,0 +1,345 @@
+import inspect
+import itertools
+import math
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .exceptions import CSFloatError
+from ._fields import get_field
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+    from .snipe import Sniper
+
+__all__ = ("Rule", "RuleMatch", "RuleEngine")
+
+ACTIONS = (None, "buy_now", "make_offer")
+
+_rule_ids = itertools.count(1)
+
+
+class Rule:
+    """A buy rule. Every condition that is set must hold for a listing to match.
+
+    ``max_price`` is in cents and ``max_price_ratio`` caps the price at that fraction of
+    ``reference.predicted_price``; with both set the lower cap applies. ``stickers`` lists
+    sticker names that must all be applied. A ``make_offer`` rule matches listings above its
+    cap as well and offers ``offer_price``, or the cap when that is not set, but never more
+    than the listed price. A ``buy_now`` rule never matches a listing without a price.
+    """
+
+    __slots__ = (
+        "rule_id",
+        "market_hash_name",
+        "def_index",
+        "paint_index",
+        "min_float",
+        "max_float",
+        "paint_seeds",
+        "stickers",
+        "max_price",
+        "max_price_ratio",
+        "action",
+        "offer_price",
+        "priority",
+        "data",
+        "_order",
+    )
+
+    def __init__(
+            self,
+            *,
+            rule_id: Any = None,
+            market_hash_name: Optional[str] = None,
+            def_index: Optional[int] = None,
+            paint_index: Optional[int] = None,
+            min_float: Optional[float] = None,
+            max_float: Optional[float] = None,
+            paint_seeds: Optional[Iterable[int]] = None,
+            stickers: Optional[Iterable[str]] = None,
+            max_price: Optional[int] = None,
+            max_price_ratio: Optional[float] = None,
+            action: Optional[str] = None,
+            offer_price: Optional[int] = None,
+            priority: int = 0,
+            data: Any = None
+    ) -> None:
+        if action not in ACTIONS:
+            raise ValueError(f'Unknown action parameter "{action}"')
+        if min_float is not None and max_float is not None and min_float > max_float:
+            raise ValueError("min_float must not be greater than max_float")
+        self._order = next(_rule_ids)
+        self.rule_id = self._order if rule_id is None else rule_id
+        self.market_hash_name = market_hash_name
+        self.def_index = def_index
+        self.paint_index = paint_index
+        self.min_float = min_float
+        self.max_float = max_float
+        self.paint_seeds = frozenset(paint_seeds) if paint_seeds is not None else None
+        self.stickers = frozenset(stickers) if stickers is not None else None
+        self.max_price = max_price
+        self.max_price_ratio = max_price_ratio
+        self.action = action
+        self.offer_price = offer_price
+        self.priority = priority
+        self.data = data
+
+    def price_cap(self, listing: Any) -> Optional[float]:
+        """Highest price the rule pays for ``listing``, or None when the rule has no price limit."""
+        caps = []
+        if self.max_price is not None:
+            caps.append(self.max_price)
+        if self.max_price_ratio is not None:
+            predicted = get_field(get_field(listing, "reference"), "predicted_price")
+            # Without a reference price a ratio rule cannot be satisfied.
+            caps.append(predicted * self.max_price_ratio if predicted is not None else -math.inf)
+        return min(caps) if caps else None
+
+    def matches(self, listing: Any) -> bool:
+        item = get_field(listing, "item")
+        if self.market_hash_name is not None and get_field(item, "market_hash_name") != self.market_hash_name:
+            return False
+        if self.def_index is not None and get_field(item, "def_index") != self.def_index:
+            return False
+        if self.paint_index is not None and get_field(item, "paint_index") != self.paint_index:
+            return False
+        if self.min_float is not None or self.max_float is not None:
+            float_value = get_field(item, "float_value")
+            if float_value is None:
+                return False
+            if self.min_float is not None and float_value < self.min_float:
+                return False
+            if self.max_float is not None and float_value > self.max_float:
+                return False
+        if self.paint_seeds is not None and get_field(item, "paint_seed") not in self.paint_seeds:
+            return False
+        if self.stickers is not None:
+            applied = {get_field(sticker, "name") for sticker in get_field(item, "stickers") or ()}
+            if not self.stickers <= applied:
+                return False
+        if self.action != "make_offer":
+            cap = self.price_cap(listing)
+            price = get_field(listing, "price")
+            # buy_now has to pay the listed price, so it cannot act on a listing without one.
+            if price is None and (cap is not None or self.action == "buy_now"):
+                return False
+            if cap is not None and price > cap:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"Rule(rule_id={self.rule_id!r}, action={self.action!r})"
+
+
+class RuleMatch:
+    """A rule that matched a listing, with the outcome of its action when one was run."""
+
+    __slots__ = ("listing", "rule", "action", "result", "error")
+
+    def __init__(self, listing: Any, rule: Rule) -> None:
+        self.listing = listing
+        self.rule = rule
+        self.action: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return f"RuleMatch(listing_id={get_field(self.listing, 'id')!r}, rule={self.rule!r}, action={self.action!r})"
+
+
+class _IntervalTree:
+    """Static centered interval tree over closed ``(low, high, rule)`` intervals."""
+
+    __slots__ = ("center", "by_low", "by_high", "left", "right")
+
+    def __init__(self, intervals: List[Tuple[float, float, Rule]]) -> None:
+        endpoints = sorted(point for low, high, _ in intervals for point in (low, high))
+        self.center = endpoints[len(endpoints) // 2]
+        here, left, right = [], [], []
+        for interval in intervals:
+            if interval[1] < self.center:
+                left.append(interval)
+            elif interval[0] > self.center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        self.by_low = sorted(here, key=lambda interval: interval[0])
+        self.by_high = sorted(here, key=lambda interval: -interval[1])
+        self.left = _IntervalTree(left) if left else None
+        self.right = _IntervalTree(right) if right else None
+
+    def stab(self, point: float, found: List[Rule]) -> None:
+        node: Optional[_IntervalTree] = self
+        while node is not None:
+            if point < node.center:
+                for low, _, rule in node.by_low:
+                    if low > point:
+                        break
+                    found.append(rule)
+                node = node.left
+            elif point > node.center:
+                for _, high, rule in node.by_high:
+                    if high < point:
+                        break
+                    found.append(rule)
+                node = node.right
+            else:
+                found.extend(rule for _, _, rule in node.by_low)
+                return
+
+
+class _Bucket:
+    __slots__ = ("rules", "unbounded", "tree")
+
+    def __init__(self) -> None:
+        self.rules: List[Rule] = []
+        self.unbounded: List[Rule] = []
+        self.tree: Optional[_IntervalTree] = None
+
+    def compile(self) -> None:
+        intervals = []
+        self.unbounded = []
+        for rule in self.rules:
+            if rule.min_float is None and rule.max_float is None:
+                self.unbounded.append(rule)
+            else:
+                low = rule.min_float if rule.min_float is not None else -math.inf
+                high = rule.max_float if rule.max_float is not None else math.inf
+                intervals.append((low, high, rule))
+        self.tree = _IntervalTree(intervals) if intervals else None
+
+    def candidates(self, float_value: Optional[float], found: List[Rule]) -> None:
+        found.extend(self.unbounded)
+        if float_value is not None and self.tree is not None:
+            self.tree.stab(float_value, found)
+
+
+class RuleEngine:
+    """Matches listings against many ``Rule`` objects without scanning them all.
+
+    Rules are bucketed by ``market_hash_name`` (or ``def_index`` when they have no name) and
+    each bucket keeps an interval tree over the rules' float ranges, so a listing is only
+    checked against rules for its skin whose float range contains its float. ``process``
+    runs the action of the highest-priority matching rule through ``client`` (or through
+    ``sniper`` for ``buy_now``) and hands every match to the registered callbacks.
+    """
+
+    __slots__ = ("client", "sniper", "dry_run", "_rules", "_buckets", "_dirty", "_callbacks")
+
+    def __init__(self, rules: Iterable[Rule] = (), *, client: Optional["Client"] = None,
+                 sniper: Optional["Sniper"] = None, dry_run: bool = False) -> None:
+        self.client = client
+        self.sniper = sniper
+        self.dry_run = dry_run
+        self._rules: Dict[Any, Rule] = {}
+        self._buckets: Dict[Tuple[str, Any], _Bucket] = {}
+        self._dirty = False
+        self._callbacks: List[Callable[[RuleMatch], Any]] = []
+        self.extend(rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def __iter__(self) -> Iterator[Rule]:
+        return iter(self._rules.values())
+
+    @staticmethod
+    def _bucket_key(rule: Rule) -> Tuple[str, Any]:
+        if rule.market_hash_name is not None:
+            return "name", rule.market_hash_name
+        if rule.def_index is not None:
+            return "def_index", rule.def_index
+        return "any", None
+
+    def add(self, rule: Rule) -> None:
+        """Adds a rule, replacing any rule with the same ``rule_id``."""
+        self.remove(rule.rule_id)
+        self._rules[rule.rule_id] = rule
+        key = self._bucket_key(rule)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+        bucket.rules.append(rule)
+        self._dirty = True
+
+    def extend(self, rules: Iterable[Rule]) -> None:
+        for rule in rules:
+            self.add(rule)
+
+    def remove(self, rule_id: Any) -> bool:
+        rule = self._rules.pop(rule_id, None)
+        if rule is None:
+            return False
+        key = self._bucket_key(rule)
+        bucket = self._buckets[key]
+        bucket.rules.remove(rule)
+        if not bucket.rules:
+            del self._buckets[key]
+        self._dirty = True
+        return True
+
+    def compile(self) -> None:
+        """Rebuilds the interval trees. Called automatically by the first match after a change."""
+        for bucket in self._buckets.values():
+            bucket.compile()
+        self._dirty = False
+
+    def add_callback(self, callback: Callable[[RuleMatch], Any]) -> None:
+        """Registers a plain or async callable invoked for every match by ``process``."""
+        self._callbacks.append(callback)
+
+    def match(self, listing: Any) -> List[Rule]:
+        """Rules matching ``listing``, highest priority (lowest value) first, then in insertion order."""
+        if self._dirty:
+            self.compile()
+        item = get_field(listing, "item")
+        float_value = get_field(item, "float_value")
+        candidates: List[Rule] = []
+        for key in (("name", get_field(item, "market_hash_name")), ("def_index", get_field(item, "def_index")), ("any", None)):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.candidates(float_value, candidates)
+        matched = [rule for rule in candidates if rule.matches(listing)]
+        matched.sort(key=lambda rule: (rule.priority, rule._order))
+        return matched
+
+    async def process(self, listing: Any) -> List[RuleMatch]:
+        """Matches ``listing`` and runs the action of the first matching rule that has one."""
+        decided_at = time.perf_counter()
+        matches = [RuleMatch(listing, rule) for rule in self.match(listing)]
+        acting = next((match for match in matches if match.rule.action is not None), None)
+        if acting is not None and not self.dry_run:
+            await self._act(acting, decided_at)
+        for match in matches:
+            for callback in self._callbacks:
+                result = callback(match)
+                if inspect.isawaitable(result):
+                    await result
+        return matches
+
+    async def _act(self, match: RuleMatch, decided_at: float) -> None:
+        listing_id, price = get_field(match.listing, "id"), get_field(match.listing, "price")
+        match.action = match.rule.action
+        try:
+            if match.action == "buy_now":
+                if self.sniper is not None:
+                    match.result = await self.sniper.snipe(listing_id, int(price), decided_at=decided_at)
+                    match.error = match.result.error
+                else:
+                    match.result = await self._client().buy_now(total_price=int(price), listing_id=listing_id)
+            else:
+                offer = match.rule.offer_price
+                if offer is None:
+                    offer = match.rule.price_cap(match.listing)
+                if offer is not None and price is not None:
+                    offer = min(offer, price)
+                if offer is None or offer <= 0:
+                    raise ValueError(f"Rule {match.rule.rule_id!r} has no offer price for listing {listing_id}")
+                match.result = await self._client().make_offer(listing_id=listing_id, price=int(offer))
+        except (CSFloatError, ValueError) as exc:
+            match.error = exc
+
+    def _client(self) -> "Client":
+        if self.client is None:
+            raise ValueError("RuleEngine needs a client to run rule actions")
+        return self.client
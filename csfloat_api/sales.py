@@ -0,0 +1,183 @@
+import bisect
+import math
+import statistics
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ._fields import as_float, as_timestamp, get_field
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+
+__all__ = ("SalesHistory", "SalesAnalyzer")
+
+# Wear boundaries: Factory New, Minimal Wear, Field-Tested, Well-Worn, Battle-Scarred.
+DEFAULT_FLOAT_BUCKETS = (0.0, 0.07, 0.15, 0.38, 0.45, 1.0)
+
+NAN = float("nan")
+
+
+class SalesHistory:
+    """Sales of one ``market_hash_name`` as columns ordered by ``sold_at`` (oldest first).
+
+    Prices are in cents like everywhere else in the API; sales without ``sold_at`` are
+    skipped. Columns are NumPy arrays when NumPy is installed and ``array.array`` otherwise.
+    """
+
+    __slots__ = ("market_hash_name", "sold_at", "price", "float_value", "_curves")
+
+    def __init__(self, market_hash_name: str, sales: Iterable[Any]) -> None:
+        rows = sorted(
+            (as_timestamp(get_field(sale, "sold_at")), as_float(get_field(sale, "price")),
+             as_float(get_field(get_field(sale, "item"), "float_value")))
+            for sale in sales if get_field(sale, "sold_at") is not None
+        )
+        self.market_hash_name = market_hash_name
+        self.sold_at = self._column([row[0] for row in rows])
+        self.price = self._column([row[1] for row in rows])
+        self.float_value = self._column([row[2] for row in rows])
+        self._curves: Dict[Tuple[float, ...], List[Tuple[float, float, float, int]]] = {}
+
+    @staticmethod
+    def _column(values: List[float]) -> Any:
+        if np is not None:
+            return np.array(values, dtype="float64")
+        return array("d", values)
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def median(self, since: Optional[float] = None) -> float:
+        """Median price, optionally of sales at or after the ``since`` timestamp."""
+        prices = self.price[self._start(since):]
+        if not len(prices):
+            return NAN
+        return float(np.median(prices)) if np is not None else statistics.median(prices)
+
+    def rolling_median(self, window: int = 20) -> Any:
+        """Median price of every ``window`` consecutive sales; one value per sale from the window-th on."""
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if len(self) < window:
+            return np.empty(0) if np is not None else array("d")
+        if np is not None:
+            return np.median(np.lib.stride_tricks.sliding_window_view(self.price, window), axis=1)
+        return array("d", (statistics.median(self.price[i - window:i]) for i in range(window, len(self) + 1)))
+
+    def volume(self, period: float = 86400.0, since: Optional[float] = None) -> int:
+        """Number of sales in the last ``period`` seconds (or since ``since``)."""
+        return len(self) - self._start(time.time() - period if since is None else since)
+
+    def float_curve(self, buckets: Sequence[float] = DEFAULT_FLOAT_BUCKETS) -> List[Tuple[float, float, float, int]]:
+        """``(low, high, median price, sales)`` per float bucket; empty buckets have a NaN median."""
+        buckets = tuple(buckets)
+        curve = self._curves.get(buckets)
+        if curve is None:
+            curve = self._curves[buckets] = self._float_curve(buckets)
+        return curve
+
+    def _float_curve(self, buckets: Tuple[float, ...]) -> List[Tuple[float, float, float, int]]:
+        curve = []
+        if np is not None:
+            floats, prices = self.float_value, self.price
+            index = np.digitize(floats, buckets[1:-1], right=True)
+            known = ~np.isnan(floats)
+            for position, (low, high) in enumerate(zip(buckets, buckets[1:])):
+                selected = prices[known & (index == position)]
+                curve.append((low, high, float(np.median(selected)) if len(selected) else NAN, len(selected)))
+            return curve
+
+        grouped: List[List[float]] = [[] for _ in range(len(buckets) - 1)]
+        for float_value, price in zip(self.float_value, self.price):
+            if not math.isnan(float_value):
+                grouped[min(bisect.bisect_left(buckets, float_value, 1) - 1, len(grouped) - 1)].append(price)
+        for (low, high), prices in zip(zip(buckets, buckets[1:]), grouped):
+            curve.append((low, high, statistics.median(prices) if prices else NAN, len(prices)))
+        return curve
+
+    def fair_value(self, float_value: Optional[float],
+                   buckets: Sequence[float] = DEFAULT_FLOAT_BUCKETS) -> float:
+        """Median sale price of the float bucket ``float_value`` falls in, else the overall median."""
+        if float_value is not None:
+            for low, high, median, count in self.float_curve(buckets):
+                if low <= float_value <= high and count:
+                    return median
+        return self.median()
+
+    def _start(self, since: Optional[float]) -> int:
+        if since is None:
+            return 0
+        if np is not None:
+            return int(np.searchsorted(self.sold_at, since, side="left"))
+        return bisect.bisect_left(self.sold_at, since)
+
+    def __repr__(self) -> str:
+        return f"SalesHistory({self.market_hash_name!r}, sales={len(self)})"
+
+
+class SalesAnalyzer:
+    """Fetches sale histories concurrently and prices listings against them.
+
+    Histories are kept per ``market_hash_name`` once fetched; requests go through
+    ``Client.get_sales``, so they also hit the client's ``sales`` cache. Names that fail to
+    load are recorded in ``errors`` instead of aborting the batch.
+    """
+
+    __slots__ = ("client", "concurrency", "buckets", "histories", "errors")
+
+    def __init__(self, client: "Client", *, concurrency: int = 10,
+                 buckets: Sequence[float] = DEFAULT_FLOAT_BUCKETS) -> None:
+        self.client = client
+        self.concurrency = concurrency
+        self.buckets = tuple(buckets)
+        self.histories: Dict[str, SalesHistory] = {}
+        self.errors: Dict[str, BaseException] = {}
+
+    async def fetch(self, market_hash_names: Iterable[str], *, refresh: bool = False) -> Dict[str, SalesHistory]:
+        """Loads the histories of the given names and returns them (only the ones that loaded)."""
+        names = list(dict.fromkeys(market_hash_names))
+        missing = [name for name in names if refresh or name not in self.histories]
+        async for result in self.client.get_sales_many(missing, concurrency=self.concurrency, raw_response=True):
+            if result.ok:
+                self.histories[result.key] = SalesHistory(result.key, result.value or ())
+                self.errors.pop(result.key, None)
+            else:
+                self.errors[result.key] = result.error
+        return {name: self.histories[name] for name in names if name in self.histories}
+
+    async def history(self, market_hash_name: str) -> Optional[SalesHistory]:
+        return (await self.fetch((market_hash_name,))).get(market_hash_name)
+
+    async def compare(self, listings: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Prices each listing against the sales of its skin and its ``reference.predicted_price``.
+
+        ``discount`` and ``predicted_discount`` are the fractions below the float-bucket fair
+        value and the predicted price (NaN when unknown).
+        """
+        listings = list(listings)
+        names = [get_field(get_field(listing, "item"), "market_hash_name") for listing in listings]
+        await self.fetch(name for name in names if name is not None)
+
+        rows = []
+        for listing, name in zip(listings, names):
+            price = as_float(get_field(listing, "price"))
+            float_value = get_field(get_field(listing, "item"), "float_value")
+            history = self.histories.get(name)
+            fair_value = history.fair_value(float_value, self.buckets) if history is not None else NAN
+            predicted = as_float(get_field(get_field(listing, "reference"), "predicted_price"))
+            rows.append({
+                "listing_id": get_field(listing, "id"),
+                "market_hash_name": name,
+                "price": price,
+                "fair_value": fair_value,
+                "predicted_price": predicted,
+                "discount": 1 - price / fair_value if fair_value else NAN,
+                "predicted_discount": 1 - price / predicted if predicted else NAN,
+            })
+        return rows
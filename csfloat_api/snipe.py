@@ -0,0 +1,175 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+import aiohttp
+from aiohttp_socks.connector import ProxyConnector
+
+from .exceptions import CSFloatError, InvalidResponse, TransportError
+from .decoding import json_loads
+from .models.listing import Listing
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+
+__all__ = ("Sniper", "SnipeResult")
+
+_BUY_TEMPLATE = '{"total_price":%d,"contract_ids":["%s"]}'
+
+
+class SnipeResult:
+    """Outcome and timings (seconds) of one ``Sniper.snipe`` call."""
+
+    __slots__ = (
+        "listing_id",
+        "total_price",
+        "response",
+        "error",
+        "listing",
+        "decision_to_send",
+        "send_to_response",
+    )
+
+    def __init__(self, listing_id: str, total_price: int) -> None:
+        self.listing_id = listing_id
+        self.total_price = total_price
+        self.response: Optional[dict] = None
+        self.error: Optional[BaseException] = None
+        self.listing: Optional[Listing] = None
+        self.decision_to_send = 0.0
+        self.send_to_response = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def price_changed(self) -> bool:
+        """Whether the concurrent re-check saw a price other than the one we paid."""
+        return self.listing is not None and self.listing.price is not None and self.listing.price != self.total_price
+
+    def __repr__(self) -> str:
+        return (f"SnipeResult(listing_id={self.listing_id!r}, ok={self.ok}, "
+                f"decision_to_send={self.decision_to_send * 1000:.2f}ms, "
+                f"send_to_response={self.send_to_response * 1000:.2f}ms)")
+
+
+class Sniper:
+    """Low-latency ``buy_now`` path with its own reserved, pre-warmed connections.
+
+    Purchases bypass the generic request path: the URL and headers are built once, the body
+    is filled into a pre-serialised template, and requests go over a dedicated session that
+    background traffic on the ``Client`` cannot occupy. They also skip the rate limiter queue
+    (the limiter is still informed of the response) and are never retried. The optional price
+    re-check via ``get_specific_listing`` runs concurrently on the regular session and does
+    not delay the purchase; ``total_price`` is what guards against paying a changed price.
+    """
+
+    __slots__ = ("client", "connections", "keepalive_interval", "_session", "_buy_url", "_keepalive_task")
+
+    def __init__(self, client: "Client", *, connections: int = 1, keepalive_interval: Optional[float] = 10.0) -> None:
+        self.client = client
+        self.connections = connections
+        self.keepalive_interval = keepalive_interval
+        self._buy_url = f"{client.base_url}/listings/buy"
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+        options = client.transport.connector_options()
+        options.update(limit=connections, limit_per_host=connections, force_close=False)
+        options.setdefault("keepalive_timeout", client.transport.keepalive_timeout)
+        if client.proxy:
+            connector = ProxyConnector.from_url(client.proxy, **options)
+        else:
+            connector = aiohttp.TCPConnector(**options)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Authorization": client.API_KEY, "Content-Type": "application/json"},
+            timeout=client.transport.timeout(),
+        )
+
+    async def __aenter__(self) -> "Sniper":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Opens the reserved connections and keeps them alive in the background."""
+        await self._ping()
+        if self.keepalive_interval and self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keep_alive())
+
+    async def close(self) -> None:
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        await self._session.close()
+
+    async def _ping(self) -> None:
+        async def ping_once() -> None:
+            try:
+                async with self._session.head(self.client.base_url, allow_redirects=False) as response:
+                    await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+        await asyncio.gather(*(ping_once() for _ in range(self.connections)))
+
+    async def _keep_alive(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            await self._ping()
+
+    async def snipe(self, listing_id: Any, total_price: int, *, decided_at: Optional[float] = None,
+                    verify: bool = True) -> SnipeResult:
+        """Buys ``listing_id`` for ``total_price`` (cents).
+
+        ``decided_at`` is the ``time.perf_counter()`` value when the caller decided to buy;
+        it defaults to the moment of the call and is used for ``decision_to_send``.
+        """
+        if decided_at is None:
+            decided_at = time.perf_counter()
+        listing_id = str(listing_id)
+        if not listing_id.isdigit():
+            raise ValueError(f'Invalid listing_id "{listing_id}"')
+        result = SnipeResult(listing_id, total_price)
+        body = (_BUY_TEMPLATE % (total_price, listing_id)).encode()
+
+        recheck = asyncio.create_task(self.client.get_specific_listing(int(listing_id))) if verify else None
+
+        try:
+            sent_at = time.perf_counter()
+            result.decision_to_send = sent_at - decided_at
+            try:
+                async with self._session.post(self._buy_url, data=body) as response:
+                    payload = await response.read()
+                    result.send_to_response = time.perf_counter() - sent_at
+                    retry_after = self.client.rate_limiter.feedback("write", response.status, response.headers)
+                    if response.status != 200:
+                        try:
+                            details: Any = json_loads(payload)
+                        except ValueError:
+                            details = payload.decode(errors="replace")
+                        raise self.client._error(response.status, details, retry_after)
+                    if response.content_type != "application/json":
+                        raise InvalidResponse(f"Expected JSON, got {response.content_type}")
+                    try:
+                        result.response = json_loads(payload)
+                    except ValueError as exc:
+                        raise InvalidResponse(f"Malformed JSON in response: {exc}") from exc
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as exc:
+                result.error = TransportError(f"{type(exc).__name__}: {exc}")
+            except CSFloatError as exc:
+                result.error = exc
+
+            if recheck is not None:
+                try:
+                    result.listing = await recheck
+                except CSFloatError:
+                    pass
+        finally:
+            # Never leave the re-check running when the purchase path raised or was cancelled.
+            if recheck is not None and not recheck.done():
+                recheck.cancel()
+        return result
@@ -0,0 +1,253 @@
+import json
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, AsyncIterable, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ._fields import get_field
+from .models.listing import Listing
+
+__all__ = ("ListingStore",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    id INTEGER PRIMARY KEY,
+    market_hash_name TEXT,
+    def_index INTEGER,
+    paint_index INTEGER,
+    paint_seed INTEGER,
+    float_value REAL,
+    price REAL,
+    predicted_price REAL,
+    state TEXT,
+    created_at TEXT,
+    sold_at TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS listings_name_price ON listings (market_hash_name, price);
+CREATE INDEX IF NOT EXISTS listings_skin ON listings (def_index, paint_index);
+CREATE INDEX IF NOT EXISTS listings_float ON listings (float_value);
+CREATE INDEX IF NOT EXISTS listings_price ON listings (price);
+CREATE INDEX IF NOT EXISTS listings_seed ON listings (paint_seed);
+
+CREATE TABLE IF NOT EXISTS listing_changes (
+    listing_id INTEGER NOT NULL,
+    changed_at REAL NOT NULL,
+    field TEXT NOT NULL,
+    old_value,
+    new_value
+);
+CREATE INDEX IF NOT EXISTS listing_changes_listing ON listing_changes (listing_id, changed_at);
+
+CREATE TRIGGER IF NOT EXISTS listings_track_changes AFTER UPDATE OF price, state, sold_at ON listings
+BEGIN
+    INSERT INTO listing_changes
+        SELECT NEW.id, NEW.last_seen, 'price', OLD.price, NEW.price WHERE OLD.price IS NOT NEW.price;
+    INSERT INTO listing_changes
+        SELECT NEW.id, NEW.last_seen, 'state', OLD.state, NEW.state WHERE OLD.state IS NOT NEW.state;
+    INSERT INTO listing_changes
+        SELECT NEW.id, NEW.last_seen, 'sold_at', OLD.sold_at, NEW.sold_at WHERE OLD.sold_at IS NOT NEW.sold_at;
+END;
+"""
+
+_UPSERT = """
+INSERT INTO listings (id, market_hash_name, def_index, paint_index, paint_seed, float_value, price,
+                      predicted_price, state, created_at, sold_at, first_seen, last_seen, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    price = excluded.price,
+    predicted_price = excluded.predicted_price,
+    state = excluded.state,
+    sold_at = COALESCE(excluded.sold_at, listings.sold_at),
+    last_seen = excluded.last_seen,
+    data = excluded.data
+"""
+
+
+def _iso(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _int(value: Any) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+class ListingStore:
+    """Local SQLite store of listings in the database file at ``path``, upserted by listing id.
+
+    Every price, state and ``sold_at`` change of a known listing is recorded in the
+    ``listing_changes`` table by a trigger. Accepts ``Listing`` objects, ``LazyModel`` views
+    or raw listing payloads, and returns ``Listing`` objects from queries.
+    """
+
+    __slots__ = ("path", "_connection")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ListingStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    @staticmethod
+    def _row(listing: Any, seen_at: float) -> Tuple[Any, ...]:
+        item = get_field(listing, "item")
+        if isinstance(listing, BaseModel):
+            data = listing.model_dump_json(by_alias=True)
+        else:
+            data = json.dumps(getattr(listing, "raw", listing), default=str)
+        return (
+            _int(get_field(listing, "id")),
+            get_field(item, "market_hash_name"),
+            _int(get_field(item, "def_index")),
+            _int(get_field(item, "paint_index")),
+            _int(get_field(item, "paint_seed")),
+            get_field(item, "float_value"),
+            get_field(listing, "price"),
+            get_field(get_field(listing, "reference"), "predicted_price"),
+            get_field(listing, "state"),
+            _iso(get_field(listing, "created_at")),
+            _iso(get_field(listing, "sold_at")),
+            seen_at,
+            seen_at,
+            data,
+        )
+
+    def add(self, listing: Any, *, seen_at: Optional[float] = None) -> None:
+        self.add_many((listing,), seen_at=seen_at)
+
+    def add_many(self, listings: Iterable[Any], *, seen_at: Optional[float] = None) -> int:
+        """Upserts listings in one transaction and returns how many were written."""
+        seen_at = time.time() if seen_at is None else seen_at
+        rows = [self._row(listing, seen_at) for listing in listings]
+        with self._connection:
+            self._connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+    async def consume(self, listings: AsyncIterable[Any], *, batch_size: int = 500) -> int:
+        """Stores a stream such as ``Client.iter_listings`` in batches; returns the number stored."""
+        batch = []
+        stored = 0
+        async for listing in listings:
+            batch.append(listing)
+            if len(batch) >= batch_size:
+                stored += self.add_many(batch)
+                batch = []
+        if batch:
+            stored += self.add_many(batch)
+        return stored
+
+    def mark_state(self, listing_ids: Iterable[int], state: str, *, sold_at: Optional[datetime] = None) -> None:
+        """Records a state change (e.g. ``sold`` or ``delisted``) for listings no longer on the market."""
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE listings SET state = ?1, sold_at = COALESCE(?2, sold_at), last_seen = ?3, "
+                "data = json_set(data, '$.state', ?1, '$.sold_at', COALESCE(?2, json_extract(data, '$.sold_at'))) "
+                "WHERE id = ?4",
+                [(state, _iso(sold_at), now, listing_id) for listing_id in listing_ids],
+            )
+
+    def get(self, listing_id: int) -> Optional[Listing]:
+        row = self._connection.execute("SELECT data FROM listings WHERE id = ?", (listing_id,)).fetchone()
+        return Listing.model_validate_json(row[0]) if row else None
+
+    def query(
+            self,
+            *,
+            market_hash_name: Optional[str] = None,
+            def_index: Optional[int] = None,
+            paint_index: Optional[int] = None,
+            paint_seeds: Optional[Iterable[int]] = None,
+            min_float: Optional[float] = None,
+            max_float: Optional[float] = None,
+            min_price: Optional[float] = None,
+            max_price: Optional[float] = None,
+            state: Optional[str] = "listed",
+            order_by: str = "price",
+            limit: Optional[int] = 100
+    ) -> List[Listing]:
+        if order_by not in ("price", "float_value", "created_at", "last_seen", "paint_seed"):
+            raise ValueError(f'Unknown order_by parameter "{order_by}"')
+        where, parameters = self._where(
+            market_hash_name=market_hash_name, def_index=def_index, paint_index=paint_index,
+            paint_seeds=paint_seeds, min_float=min_float, max_float=max_float,
+            min_price=min_price, max_price=max_price, state=state,
+        )
+        sql = f"SELECT data FROM listings {where} ORDER BY {order_by}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return [Listing.model_validate_json(row[0]) for row in self._connection.execute(sql, parameters)]
+
+    def cheapest_per_skin(
+            self,
+            *,
+            min_float: Optional[float] = None,
+            max_float: Optional[float] = None,
+            def_index: Optional[int] = None,
+            state: Optional[str] = "listed"
+    ) -> List[Listing]:
+        """Cheapest matching listing for every ``market_hash_name``."""
+        where, parameters = self._where(min_float=min_float, max_float=max_float, def_index=def_index, state=state)
+        # SQLite takes bare columns of an aggregate query from the row that produced MIN().
+        sql = (f"SELECT MIN(price), data FROM listings {where} {'AND' if where else 'WHERE'} "
+               f"market_hash_name IS NOT NULL GROUP BY market_hash_name")
+        return [Listing.model_validate_json(row[1]) for row in self._connection.execute(sql, parameters)]
+
+    def changes(self, listing_id: Optional[int] = None,
+                since: Optional[float] = None) -> List[Tuple[int, float, str, Any, Any]]:
+        """``(listing_id, changed_at, field, old_value, new_value)`` rows, oldest first."""
+        clauses, parameters = [], []
+        if listing_id is not None:
+            clauses.append("listing_id = ?")
+            parameters.append(listing_id)
+        if since is not None:
+            clauses.append("changed_at >= ?")
+            parameters.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._connection.execute(
+            f"SELECT listing_id, changed_at, field, old_value, new_value FROM listing_changes {where} "
+            f"ORDER BY changed_at, rowid", parameters
+        ).fetchall()
+
+    @staticmethod
+    def _where(**conditions: Any) -> Tuple[str, List[Any]]:
+        clauses, parameters = [], []
+        for column in ("market_hash_name", "def_index", "paint_index", "state"):
+            value = conditions.get(column)
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        for key, column, op in (
+                ("min_float", "float_value", ">="), ("max_float", "float_value", "<="),
+                ("min_price", "price", ">="), ("max_price", "price", "<="),
+        ):
+            value = conditions.get(key)
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                parameters.append(value)
+        seeds = conditions.get("paint_seeds")
+        if seeds is not None:
+            seeds = list(seeds)
+            clauses.append(f"paint_seed IN ({','.join('?' * len(seeds))})")
+            parameters.extend(seeds)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), parameters
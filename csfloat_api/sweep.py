@@ -0,0 +1,232 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from .decoding import decode as decode_model
+from .models.listing import Listing
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+    from .pool import ClientPool
+
+__all__ = ("Shard", "MarketSweep", "make_shards", "sweep_in_processes")
+
+# Initial price boundaries in cents. Prices on the market are heavily skewed towards the
+# low end, so the ranges widen geometrically; shards that are still too deep get split.
+DEFAULT_PRICE_SPLITS = (0, 50, 100, 200, 400, 800, 1500, 3000, 6000, 12000, 25000, 50000, 100000)
+
+
+class Shard:
+    """One slice of the search space: an inclusive price range plus optional filters."""
+
+    __slots__ = ("min_price", "max_price", "def_index", "category", "cursor")
+
+    def __init__(self, min_price: int, max_price: Optional[int] = None, *, def_index: Optional[int] = None,
+                 category: int = 0, cursor: Optional[str] = None) -> None:
+        self.min_price = min_price
+        self.max_price = max_price
+        self.def_index = def_index
+        self.category = category
+        self.cursor = cursor
+
+    def split(self, price: int) -> Tuple["Shard", ...]:
+        """Shards covering ``[price, max_price]``: halves of the range, or one shard if it cannot shrink."""
+        if self.max_price is None:
+            middle = max(price * 2, price + 1)
+        elif self.max_price - price >= 1:
+            middle = (price + self.max_price) // 2
+        else:
+            return (self._with(price, self.max_price),)
+        return self._with(price, middle), self._with(middle + 1, self.max_price)
+
+    def _with(self, min_price: int, max_price: Optional[int]) -> "Shard":
+        return Shard(min_price, max_price, def_index=self.def_index, category=self.category)
+
+    def __repr__(self) -> str:
+        return (f"Shard(min_price={self.min_price!r}, max_price={self.max_price!r}, "
+                f"def_index={self.def_index!r}, category={self.category!r})")
+
+
+def make_shards(price_splits: Sequence[int] = DEFAULT_PRICE_SPLITS, *,
+                def_indexes: Optional[Iterable[int]] = None,
+                categories: Optional[Iterable[int]] = None) -> List[Shard]:
+    """Cross product of the price ranges between ``price_splits`` with the given def_indexes and categories."""
+    bounds = sorted(set(price_splits))
+    ranges = [(low, high - 1) for low, high in zip(bounds, bounds[1:])] + [(bounds[-1], None)]
+    return [
+        Shard(low, high, def_index=def_index, category=category)
+        for def_index in (list(def_indexes) if def_indexes is not None else [None])
+        for category in (list(categories) if categories is not None else [0])
+        for low, high in ranges
+    ]
+
+
+class MarketSweep:
+    """Crawls ``get_all_listings`` as many price-range shards with concurrent cursor chains.
+
+    Every shard pages with ``sort_by='lowest_price'``. A shard that still has a cursor after
+    ``max_pages`` pages is split at the last price it reached, so deep ranges fan out while
+    shallow ones finish in a page or two. Listings are de-duplicated by id across shards.
+    Pass a ``ClientPool`` as ``client`` to spread the shards over several proxies.
+    """
+
+    __slots__ = ("client", "shards", "concurrency", "max_pages", "limit", "decode", "filters",
+                 "pages", "splits", "duplicates")
+
+    def __init__(
+            self,
+            client: Union["Client", "ClientPool"],
+            shards: Optional[Iterable[Shard]] = None,
+            *,
+            concurrency: int = 8,
+            max_pages: int = 10,
+            limit: int = 50,
+            decode: str = "validate",
+            **filters: Any
+    ) -> None:
+        for reserved in ("sort_by", "cursor", "min_price", "max_price", "def_index", "category",
+                         "raw_response", "limit"):
+            if reserved in filters:
+                raise ValueError(f'MarketSweep does not accept the "{reserved}" parameter')
+        self.client = client
+        self.shards = list(shards) if shards is not None else make_shards()
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.limit = limit
+        self.decode = decode
+        self.filters = filters
+        self.pages = 0
+        self.splits = 0
+        self.duplicates = 0
+
+    async def _crawl(self, shard: Shard, queue: asyncio.Queue, found: asyncio.Queue) -> None:
+        cursor = shard.cursor
+        for _ in range(self.max_pages):
+            response = await self.client.get_all_listings(
+                min_price=shard.min_price, max_price=shard.max_price, def_index=shard.def_index,
+                category=shard.category, sort_by='lowest_price', cursor=cursor, limit=self.limit,
+                raw_response=True, **self.filters
+            )
+            self.pages += 1
+            page = response.get("data") or []
+            cursor = response.get("cursor")
+            for item in page:
+                await found.put(item)
+            if not page or not cursor:
+                return
+
+        last_price = int(page[-1].get("price") or shard.min_price)
+        if last_price <= shard.min_price:
+            # Every listing so far shares one price: splitting cannot narrow it, keep paging.
+            queue.put_nowait(Shard(shard.min_price, shard.max_price, def_index=shard.def_index,
+                                   category=shard.category, cursor=cursor))
+            return
+        self.splits += 1
+        for child in shard.split(last_price):
+            queue.put_nowait(child)
+
+    async def stream(self) -> AsyncIterator[Any]:
+        """Yields every unique listing as soon as a shard returns it. Only the ids seen are kept."""
+        queue: asyncio.Queue = asyncio.Queue()
+        found: asyncio.Queue = asyncio.Queue(maxsize=self.limit * self.concurrency * 2)
+        for shard in self.shards:
+            queue.put_nowait(shard)
+        done = object()
+        seen: Set[Any] = set()
+        errors: List[BaseException] = []
+
+        async def worker() -> None:
+            try:
+                while not queue.empty():
+                    shard = queue.get_nowait()
+                    try:
+                        await self._crawl(shard, queue, found)
+                    finally:
+                        queue.task_done()
+            except Exception as exc:
+                errors.append(exc)
+
+        async def supervise() -> None:
+            # Workers exit when the queue drains; splits may refill it while others still run.
+            running: List[asyncio.Task] = []
+            try:
+                while True:
+                    running = [task for task in running if not task.done()]
+                    while len(running) < self.concurrency and not queue.empty() and not errors:
+                        running.append(asyncio.create_task(worker()))
+                    if not running:
+                        break
+                    await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in running:
+                    task.cancel()
+            await found.put(done)
+
+        supervisor = asyncio.create_task(supervise())
+        try:
+            while True:
+                item = await found.get()
+                if item is done:
+                    break
+                listing_id = item.get("id")
+                if listing_id in seen:
+                    self.duplicates += 1
+                    continue
+                seen.add(listing_id)
+                yield decode_model(Listing, item, self.decode)
+            if errors:
+                raise errors[0]
+        finally:
+            supervisor.cancel()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.stream()
+
+    async def run(self) -> Dict[int, Any]:
+        """Sweeps every shard and returns the listings keyed by id."""
+        return {listing.id: listing async for listing in self.stream()}
+
+
+def _sweep_worker(api_key: str, proxy: Optional[str], client_options: Dict[str, Any],
+                  shards: List[Shard], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    from .csfloat_client import Client
+
+    async def sweep() -> List[Dict[str, Any]]:
+        async with Client(api_key, proxy, **client_options) as client:
+            market_sweep = MarketSweep(client, shards, decode="lazy", **options)
+            return [listing.raw async for listing in market_sweep.stream()]
+
+    return asyncio.run(sweep())
+
+
+async def sweep_in_processes(
+        api_key: str,
+        proxies: Sequence[Optional[str]] = (None,),
+        shards: Optional[Iterable[Shard]] = None,
+        *,
+        workers: Optional[int] = None,
+        client_options: Optional[Dict[str, Any]] = None,
+        decode: str = "validate",
+        **options: Any
+) -> Dict[int, Any]:
+    """Runs a ``MarketSweep`` in each of ``workers`` processes, each with its own ``Client``.
+
+    Shards are dealt round-robin to the workers and worker ``i`` uses ``proxies[i % len(proxies)]``.
+    ``options`` are passed to ``MarketSweep``; listings are merged and de-duplicated by id.
+    """
+    shards = list(shards) if shards is not None else make_shards()
+    workers = workers or len(proxies)
+    portions = [shards[index::workers] for index in range(workers)]
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, _sweep_worker, api_key, proxies[index % len(proxies)],
+                                 client_options or {}, portion, options)
+            for index, portion in enumerate(portions) if portion
+        ))
+    listings: Dict[int, Any] = {}
+    for payloads in results:
+        for item in payloads:
+            if item.get("id") not in listings:
+                listings[item.get("id")] = decode_model(Listing, item, decode)
+    return listings
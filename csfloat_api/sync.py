@@ -0,0 +1,223 @@
+import asyncio
+import json
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from .decoding import decode as decode_model
+from ._fields import as_timestamp
+from .models.buy_orders import BuyOrders
+from .models.trade import Trade
+from .models.transaction import Transaction
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+
+__all__ = ("SyncEngine", "SyncTruncated", "SyncIncomplete")
+
+# Fetches one page (page number, page size) and returns its raw records, newest first.
+_PageFetcher = Callable[[int, int], Awaitable[List[Dict[str, Any]]]]
+
+
+def _records(response: Any, key: str) -> List[Dict[str, Any]]:
+    if isinstance(response, dict):
+        return response.get(key) or []
+    return response or []
+
+
+class SyncTruncated(Exception):
+    """A stream hit ``max_pages`` before reaching its high-water mark; its checkpoint was kept.
+
+    ``records`` holds the new rows fetched before the limit; increase ``max_pages`` and sync again
+    to get the rest.
+    """
+
+    def __init__(self, stream: str, records: List[Any]) -> None:
+        super().__init__(f'Sync of "{stream}" stopped at max_pages before reaching its checkpoint')
+        self.stream = stream
+        self.records = records
+
+
+class SyncIncomplete(Exception):
+    """Some streams of ``sync_all`` failed or were truncated.
+
+    Their checkpoints were kept. ``results`` holds the new records of every stream that
+    returned any, including the partial records of truncated streams, and ``errors`` the
+    exception per failed stream.
+    """
+
+    def __init__(self, results: Dict[str, List[Any]], errors: Dict[str, BaseException]) -> None:
+        super().__init__(f'Sync failed for {", ".join(sorted(errors))}')
+        self.results = results
+        self.errors = errors
+
+
+class _Checkpoint:
+    """Newest ``created_at`` synced so far and the ids of the records that share it."""
+
+    __slots__ = ("created_at", "ids")
+
+    def __init__(self, created_at: Optional[float] = None, ids: Optional[Set[Any]] = None) -> None:
+        self.created_at = created_at
+        self.ids: Set[Any] = ids or set()
+
+    def is_new(self, created_at: Optional[float], record_id: Any) -> bool:
+        if record_id in self.ids:
+            return False
+        return self.created_at is None or created_at is None or created_at >= self.created_at
+
+    def reached(self, created_at: Optional[float]) -> bool:
+        return self.created_at is not None and created_at is not None and created_at < self.created_at
+
+    def advance(self, created_at: Optional[float], record_id: Any) -> None:
+        if created_at is None:
+            return
+        if self.created_at is None or created_at > self.created_at:
+            self.created_at = created_at
+            self.ids = {record_id}
+        elif created_at == self.created_at:
+            self.ids.add(record_id)
+
+
+class SyncEngine:
+    """Incrementally downloads account history, transferring only rows newer than the last run.
+
+    The newest-first page endpoints (transactions, trades, trade history, buy orders) are read
+    page 0 first and then ``concurrency`` pages at a time until a page reaches the stored
+    high-water mark (newest ``created_at`` seen, plus the ids at that instant). Checkpoints are
+    kept in a SQLite database file at ``path`` and only advance once a stream synced completely;
+    a stream that runs into ``max_pages`` first raises ``SyncTruncated`` and keeps its old mark.
+    The first run of a stream downloads it entirely.
+    """
+
+    __slots__ = ("client", "path", "concurrency", "page_size", "max_pages", "decode", "_connection")
+
+    def __init__(self, client: "Client", path: str, *, concurrency: int = 4, page_size: int = 30,
+                 max_pages: int = 10_000, decode: str = "validate") -> None:
+        self.client = client
+        self.path = path
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.decode = decode
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sync_checkpoints ("
+            "stream TEXT PRIMARY KEY, created_at REAL, ids TEXT NOT NULL, synced_at REAL NOT NULL)"
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def checkpoint(self, stream: str) -> Optional[Tuple[Optional[float], List[Any]]]:
+        """``(created_at timestamp, ids)`` of the stream's high-water mark, or None before its first sync."""
+        row = self._connection.execute(
+            "SELECT created_at, ids FROM sync_checkpoints WHERE stream = ?", (stream,)
+        ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def reset(self, stream: Optional[str] = None) -> None:
+        """Forgets the checkpoint of ``stream`` (or of every stream) so it is downloaded in full again."""
+        with self._connection:
+            if stream is None:
+                self._connection.execute("DELETE FROM sync_checkpoints")
+            else:
+                self._connection.execute("DELETE FROM sync_checkpoints WHERE stream = ?", (stream,))
+
+    def _load(self, stream: str) -> _Checkpoint:
+        saved = self.checkpoint(stream)
+        return _Checkpoint(saved[0], set(saved[1])) if saved else _Checkpoint()
+
+    def _save(self, stream: str, checkpoint: _Checkpoint) -> None:
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_checkpoints (stream, created_at, ids, synced_at) VALUES (?, ?, ?, ?)",
+                (stream, checkpoint.created_at, json.dumps(sorted(checkpoint.ids, key=str)), time.time()),
+            )
+
+    async def _sync(self, stream: str, fetch: _PageFetcher, model: Type[BaseModel]) -> List[Any]:
+        mark = self._load(stream)
+        advanced = _Checkpoint(mark.created_at, set(mark.ids))
+        new: Dict[Any, Dict[str, Any]] = {}
+
+        def collect(records: List[Dict[str, Any]]) -> bool:
+            """Keeps the new records of a page; True when paging can stop after it."""
+            for record in records:
+                created_at = as_timestamp(record.get("created_at")) if record.get("created_at") else None
+                record_id = record.get("id")
+                if mark.is_new(created_at, record_id) and record_id not in new:
+                    new[record_id] = record
+                    advanced.advance(created_at, record_id)
+            if len(records) < self.page_size:
+                return True
+            return any(mark.reached(as_timestamp(record["created_at"]))
+                       for record in records if record.get("created_at"))
+
+        # Page 0 alone first: an up-to-date stream costs a single request.
+        done = collect(await fetch(0, self.page_size))
+        page = 1
+        while not done and page < self.max_pages:
+            window = range(page, min(page + self.concurrency, self.max_pages))
+            pages = await asyncio.gather(*(fetch(number, self.page_size) for number in window))
+            for records in pages:
+                if collect(records):
+                    done = True
+                    break
+            page = window.stop
+
+        records = [decode_model(model, record, self.decode) for record in new.values()]
+        if not done:
+            raise SyncTruncated(stream, records)
+        self._save(stream, advanced)
+        return records
+
+    async def sync_transactions(self) -> List[Transaction]:
+        async def fetch(page: int, limit: int) -> List[Dict[str, Any]]:
+            return _records(await self.client.get_transactions(page=page, limit=limit), "transactions")
+        return await self._sync("transactions", fetch, Transaction)
+
+    async def sync_trades(self, role: str = "seller") -> List[Trade]:
+        async def fetch(page: int, limit: int) -> List[Dict[str, Any]]:
+            trades = await self.client.get_trades(role=role, limit=limit, page=page, decode="lazy")
+            return [trade.raw for trade in trades]
+        return await self._sync(f"trades:{role}", fetch, Trade)
+
+    async def sync_trade_history(self, role: str = "seller") -> List[Trade]:
+        async def fetch(page: int, limit: int) -> List[Dict[str, Any]]:
+            trades = await self.client.get_trade_history(role=role, limit=limit, page=page, decode="lazy")
+            return [trade.raw for trade in trades]
+        return await self._sync(f"trade_history:{role}", fetch, Trade)
+
+    async def sync_buy_orders(self) -> List[BuyOrders]:
+        async def fetch(page: int, limit: int) -> List[Dict[str, Any]]:
+            return _records(await self.client.get_my_buy_orders(page=page, limit=limit), "orders")
+        return await self._sync("buy_orders", fetch, BuyOrders)
+
+    async def sync_all(self, roles: Tuple[str, ...] = ("seller", "buyer")) -> Dict[str, List[Any]]:
+        """Syncs every stream concurrently and returns the new records per stream name.
+
+        A failing stream does not stop the others; once all have finished, ``SyncIncomplete``
+        carries the records that were synced, since those streams' checkpoints already advanced.
+        """
+        jobs: Dict[str, Awaitable[List[Any]]] = {
+            "transactions": self.sync_transactions(),
+            "buy_orders": self.sync_buy_orders(),
+        }
+        for role in roles:
+            jobs[f"trades:{role}"] = self.sync_trades(role)
+        outcomes = await asyncio.gather(*jobs.values(), return_exceptions=True)
+        results: Dict[str, List[Any]] = {}
+        errors: Dict[str, BaseException] = {}
+        for stream, outcome in zip(jobs, outcomes):
+            if isinstance(outcome, SyncTruncated):
+                results[stream] = outcome.records
+                errors[stream] = outcome
+            elif isinstance(outcome, BaseException):
+                errors[stream] = outcome
+            else:
+                results[stream] = outcome
+        if errors:
+            raise SyncIncomplete(results, errors)
+        return results
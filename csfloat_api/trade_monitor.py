@@ -0,0 +1,199 @@
+import asyncio
+import inspect
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set
+
+from .exceptions import CSFloatError
+from .models.trade import Trade
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+
+__all__ = ("TradeEvent", "TradeMonitor")
+
+
+class TradeEvent:
+    NEW = "new"
+    STATE_CHANGED = "state_changed"
+    OFFER_STATE_CHANGED = "offer_state_changed"
+    RESOLVED = "resolved"
+    ACCEPTED = "accepted"
+    ACCEPT_FAILED = "accept_failed"
+    ERROR = "error"
+
+    __slots__ = ("kind", "trade_id", "trade", "old_state", "error")
+
+    def __init__(self, kind: str, trade_id: Any, trade: Optional[Trade] = None, old_state: Any = None,
+                 error: Optional[BaseException] = None) -> None:
+        self.kind = kind
+        self.trade_id = trade_id
+        self.trade = trade
+        self.old_state = old_state
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"TradeEvent(kind={self.kind!r}, trade_id={self.trade_id!r})"
+
+
+def _offer_state(trade: Trade) -> Optional[int]:
+    return trade.steam_offer.state if trade.steam_offer is not None else None
+
+
+class TradeMonitor:
+    """Watches pending trades, reports changes and accepts sales before their deadlines.
+
+    Each tick reads ``get_pending_trades`` and diffs ``Trade.state`` and
+    ``steam_offer.state`` against the previous tick; trades that leave the pending list are
+    reported as resolved. The delay until the next tick follows the nearest upcoming
+    ``steam_offer.deadline_at`` or ``verify_sale_at``: ``min_interval`` once a deadline is
+    within ``lead_time`` seconds or a sale waits for acceptance, growing up to
+    ``max_interval`` when nothing is due. With ``auto_accept`` every sale not yet accepted
+    is accepted; all accepts of a tick, including those queued with ``accept``, go out in a
+    single ``accept_sale`` call. A tick that fails with ``CSFloatError`` is reported as an
+    ``error`` event and retried after ``min_interval``; monitoring does not stop.
+    """
+
+    __slots__ = (
+        "client",
+        "min_interval",
+        "max_interval",
+        "lead_time",
+        "auto_accept",
+        "steam_id",
+        "limit",
+        "_trades",
+        "_accepted",
+        "_to_accept",
+        "_primed",
+        "_callbacks",
+    )
+
+    def __init__(
+            self,
+            client: "Client",
+            *,
+            min_interval: float = 1.0,
+            max_interval: float = 60.0,
+            lead_time: float = 30.0,
+            auto_accept: bool = False,
+            steam_id: Optional[str] = None,
+            limit: int = 500
+    ) -> None:
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.lead_time = lead_time
+        self.auto_accept = auto_accept
+        self.steam_id = steam_id
+        self.limit = limit
+        self._trades: Dict[Any, Trade] = {}
+        self._accepted: Set[Any] = set()
+        self._to_accept: Set[Any] = set()
+        self._primed = False
+        self._callbacks: List[Callable[[TradeEvent], Any]] = []
+
+    @property
+    def trades(self) -> List[Trade]:
+        """Pending trades as of the last tick."""
+        return list(self._trades.values())
+
+    def add_callback(self, callback: Callable[[TradeEvent], Any]) -> None:
+        """Registers a plain or async callable invoked for every event by ``run``."""
+        self._callbacks.append(callback)
+
+    def accept(self, trade_ids: Iterable[Any]) -> None:
+        """Queues trades to be accepted in the next tick's ``accept_sale`` call."""
+        self._to_accept.update(trade_ids)
+
+    def _needs_accept(self, trade: Trade) -> bool:
+        return (trade.state == "pending" and trade.accepted_at is None and trade.id not in self._accepted
+                and self.steam_id is not None and trade.seller_id == self.steam_id)
+
+    async def poll(self) -> List[TradeEvent]:
+        """Runs one tick and returns the events it produced."""
+        if self.auto_accept and self.steam_id is None:
+            me = await self.client.get_me()
+            self.steam_id = me.user.steam_id if me.user is not None else None
+
+        pending = await self.client.get_pending_trades(limit=self.limit)
+        events = []
+        current: Dict[Any, Trade] = {}
+        for trade in pending:
+            current[trade.id] = trade
+            previous = self._trades.get(trade.id)
+            if previous is None:
+                if self._primed:
+                    events.append(TradeEvent(TradeEvent.NEW, trade.id, trade))
+                continue
+            if previous.state != trade.state:
+                events.append(TradeEvent(TradeEvent.STATE_CHANGED, trade.id, trade, previous.state))
+            if _offer_state(previous) != _offer_state(trade):
+                events.append(TradeEvent(TradeEvent.OFFER_STATE_CHANGED, trade.id, trade, _offer_state(previous)))
+        for trade_id, previous in self._trades.items():
+            if trade_id not in current:
+                events.append(TradeEvent(TradeEvent.RESOLVED, trade_id, previous, previous.state))
+        self._trades = current
+        self._accepted &= current.keys()
+        self._primed = True
+
+        if self.auto_accept:
+            self._to_accept.update(trade.id for trade in pending if self._needs_accept(trade))
+        if self._to_accept:
+            events.extend(await self._flush_accepts())
+        return events
+
+    async def _flush_accepts(self) -> List[TradeEvent]:
+        trade_ids = sorted(self._to_accept, key=str)
+        self._to_accept.clear()
+        try:
+            await self.client.accept_sale(trade_ids=[str(trade_id) for trade_id in trade_ids])
+        except CSFloatError as exc:
+            return [TradeEvent(TradeEvent.ACCEPT_FAILED, trade_id, self._trades.get(trade_id), error=exc)
+                    for trade_id in trade_ids]
+        self._accepted.update(trade_ids)
+        return [TradeEvent(TradeEvent.ACCEPTED, trade_id, self._trades.get(trade_id)) for trade_id in trade_ids]
+
+    def next_interval(self, now: Optional[float] = None) -> float:
+        """Seconds until the next tick, based on the nearest deadline of the pending trades."""
+        now = time.time() if now is None else now
+        if self._to_accept or (self.auto_accept and any(map(self._needs_accept, self._trades.values()))):
+            return self.min_interval
+        nearest = None
+        for trade in self._trades.values():
+            deadlines = (trade.steam_offer.deadline_at if trade.steam_offer is not None else None,
+                         trade.verify_sale_at)
+            for deadline in deadlines:
+                if deadline is None:
+                    continue
+                remaining = deadline.timestamp() - now
+                if remaining > 0 and (nearest is None or remaining < nearest):
+                    nearest = remaining
+        if nearest is None:
+            return self.max_interval
+        # Sleep half of the time left before the deadline enters the lead window.
+        return min(self.max_interval, max(self.min_interval, (nearest - self.lead_time) / 2))
+
+    async def events(self) -> AsyncIterator[TradeEvent]:
+        while True:
+            try:
+                events = await self.poll()
+            except CSFloatError as exc:
+                yield TradeEvent(TradeEvent.ERROR, None, error=exc)
+                await asyncio.sleep(self.min_interval)
+                continue
+            for event in events:
+                yield event
+            await asyncio.sleep(self.next_interval())
+
+    def __aiter__(self) -> AsyncIterator[TradeEvent]:
+        return self.events()
+
+    async def run(self) -> None:
+        """Polls forever, passing every event to the registered callbacks."""
+        async for event in self.events():
+            for callback in self._callbacks:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result
@@ -0,0 +1,128 @@
+import ssl as ssl_module
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Union
+
+import aiohttp
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import AsyncResolver, ThreadedResolver
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+    from .metrics import RequestInfo
+
+__all__ = ("TransportConfig", "TransportBackend")
+
+
+class TransportConfig:
+    """Connection pool, DNS, TLS and timeout settings for a ``Client`` session.
+
+    ``ssl`` keeps the historical default of ``False`` (no certificate verification). Pass
+    ``True`` or an ``ssl.SSLContext``; one context is built and shared by every connection
+    of the session. Timeouts are in seconds, ``None`` disables the respective limit.
+    """
+
+    __slots__ = (
+        "limit",
+        "limit_per_host",
+        "keepalive_timeout",
+        "force_close",
+        "use_dns_cache",
+        "ttl_dns_cache",
+        "resolver",
+        "ssl",
+        "total_timeout",
+        "connect_timeout",
+        "sock_connect_timeout",
+        "sock_read_timeout",
+        "_ssl_context",
+    )
+
+    def __init__(
+            self,
+            *,
+            limit: int = 100,
+            limit_per_host: int = 50,
+            keepalive_timeout: float = 30.0,
+            force_close: bool = False,
+            use_dns_cache: bool = True,
+            ttl_dns_cache: Optional[int] = 300,
+            resolver: Union[str, AbstractResolver] = "threaded",
+            ssl: Union[bool, ssl_module.SSLContext] = False,
+            total_timeout: Optional[float] = 300.0,
+            connect_timeout: Optional[float] = None,
+            sock_connect_timeout: Optional[float] = 30.0,
+            sock_read_timeout: Optional[float] = None
+    ) -> None:
+        if isinstance(resolver, str) and resolver not in ("threaded", "async"):
+            raise ValueError(f'Unknown resolver parameter "{resolver}"')
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.force_close = force_close
+        self.use_dns_cache = use_dns_cache
+        self.ttl_dns_cache = ttl_dns_cache
+        self.resolver = resolver
+        self.ssl = ssl
+        self.total_timeout = total_timeout
+        self.connect_timeout = connect_timeout
+        self.sock_connect_timeout = sock_connect_timeout
+        self.sock_read_timeout = sock_read_timeout
+        self._ssl_context: Optional[ssl_module.SSLContext] = None
+
+    def build_resolver(self) -> AbstractResolver:
+        if isinstance(self.resolver, AbstractResolver):
+            return self.resolver
+        if self.resolver == "async":
+            return AsyncResolver()
+        return ThreadedResolver()
+
+    def ssl_option(self) -> Union[bool, ssl_module.SSLContext]:
+        if self.ssl is True:
+            if self._ssl_context is None:
+                self._ssl_context = ssl_module.create_default_context()
+            return self._ssl_context
+        return self.ssl
+
+    def connector_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by ``aiohttp.TCPConnector`` and ``ProxyConnector``."""
+        options: Dict[str, Any] = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "use_dns_cache": self.use_dns_cache,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "resolver": self.build_resolver(),
+            "ssl": self.ssl_option(),
+            "force_close": self.force_close,
+        }
+        if not self.force_close:
+            options["keepalive_timeout"] = self.keepalive_timeout
+        return options
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.sock_connect_timeout,
+            sock_read=self.sock_read_timeout,
+        )
+
+
+class TransportBackend(ABC):
+    """Replaces the network round trip of a ``Client`` (see ``csfloat_api.cassette``).
+
+    ``send`` receives what ``Client._send`` would and returns ``(status, headers, data)`` or
+    raises like it. Retries, hooks and caching still run in the client around it; the
+    client's rate limiter is skipped when ``rate_limited`` is false.
+    """
+
+    __slots__ = ()
+
+    rate_limited = True
+
+    @abstractmethod
+    async def send(self, client: "Client", method: str, parameters: str, budget: str, json_data: Any,
+                   headers: Optional[Dict[str, str]], info: "RequestInfo") -> Tuple[int, Mapping[str, str], Any]:
+        ...
+
+    async def close(self) -> None:
+        pass
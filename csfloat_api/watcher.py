@@ -0,0 +1,163 @@
+import asyncio
+import inspect
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, List, Optional, Tuple
+
+from .exceptions import CSFloatError
+
+if TYPE_CHECKING:
+    from .csfloat_client import Client
+
+__all__ = ("ListingEvent", "ListingWatcher")
+
+
+class ListingEvent:
+    NEW = "new"
+    REMOVED = "removed"
+    PRICE_CHANGED = "price_changed"
+    ERROR = "error"
+
+    __slots__ = ("kind", "listing_id", "listing", "old_price", "error")
+
+    def __init__(self, kind: str, listing_id: Optional[int], listing: Any = None, old_price: Optional[float] = None,
+                 error: Optional[BaseException] = None) -> None:
+        self.kind = kind
+        self.listing_id = listing_id
+        self.listing = listing
+        self.old_price = old_price
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"ListingEvent(kind={self.kind!r}, listing_id={self.listing_id!r})"
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+class ListingWatcher:
+    """Detects market changes by polling the ``most_recent`` feed only down to known listings.
+
+    Each tick pages ``get_all_listings(sort_by='most_recent')`` until a page contains an
+    already-seen listing, so the cost per tick follows the number of new listings rather than
+    the size of the market. Listings from the previous tick that fall inside the time window
+    covered by the current tick but are no longer returned are reported as removed. The first
+    tick only records what is on the market unless ``emit_initial`` is set. More than
+    ``max_pages`` pages of new listings in a single tick are truncated. A tick that fails with
+    ``CSFloatError`` is reported as an ``error`` event and polling carries on.
+    """
+
+    __slots__ = (
+        "client",
+        "interval",
+        "max_pages",
+        "max_seen",
+        "emit_initial",
+        "filters",
+        "_seen",
+        "_window",
+        "_primed",
+        "_callbacks",
+    )
+
+    def __init__(
+            self,
+            client: "Client",
+            *,
+            interval: float = 1.0,
+            max_pages: int = 10,
+            max_seen: int = 100_000,
+            emit_initial: bool = False,
+            **filters: Any
+    ) -> None:
+        for reserved in ("sort_by", "cursor", "raw_response"):
+            if reserved in filters:
+                raise ValueError(f'ListingWatcher does not accept the "{reserved}" parameter')
+        self.client = client
+        self.interval = interval
+        self.max_pages = max_pages
+        self.max_seen = max_seen
+        self.emit_initial = emit_initial
+        self.filters = filters
+        # listing id -> (price, created_at timestamp)
+        self._seen: "OrderedDict[int, Tuple[Optional[float], Optional[float]]]" = OrderedDict()
+        self._window: List[int] = []
+        self._primed = False
+        self._callbacks: List[Callable[[ListingEvent], Any]] = []
+
+    def add_callback(self, callback: Callable[[ListingEvent], Any]) -> None:
+        """Registers a plain or async callable invoked for every event by ``run``."""
+        self._callbacks.append(callback)
+
+    def _remember(self, listing_id: int, price: Optional[float], created_at: Optional[float]) -> None:
+        self._seen[listing_id] = (price, created_at)
+        self._seen.move_to_end(listing_id)
+        while len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+
+    async def poll(self) -> List[ListingEvent]:
+        """Runs one tick and returns the events it produced."""
+        emit = self._primed or self.emit_initial
+        observed = []
+        cursor = None
+        # Priming only needs the newest page to know where the feed starts.
+        for _ in range(self.max_pages if emit else 1):
+            response = await self.client.get_all_listings(sort_by='most_recent', cursor=cursor, **self.filters)
+            page = response["listings"]
+            observed.extend(page)
+            cursor = response.get("cursor")
+            if not page or not cursor or any(listing.id in self._seen for listing in page):
+                break
+
+        events = []
+        observed_ids = set()
+        oldest: Optional[float] = None
+        for listing in observed:
+            if listing.id in observed_ids:
+                continue
+            observed_ids.add(listing.id)
+            created_at = _timestamp(listing.created_at)
+            if created_at is not None and (oldest is None or created_at < oldest):
+                oldest = created_at
+
+            previous = self._seen.get(listing.id)
+            if previous is None:
+                if emit:
+                    events.append(ListingEvent(ListingEvent.NEW, listing.id, listing))
+            elif previous[0] != listing.price:
+                events.append(ListingEvent(ListingEvent.PRICE_CHANGED, listing.id, listing, previous[0]))
+            self._remember(listing.id, listing.price, created_at)
+
+        if self._primed and oldest is not None:
+            for listing_id in self._window:
+                if listing_id in observed_ids:
+                    continue
+                previous = self._seen.get(listing_id)
+                if previous is not None and previous[1] is not None and previous[1] >= oldest:
+                    events.append(ListingEvent(ListingEvent.REMOVED, listing_id, old_price=previous[0]))
+                    del self._seen[listing_id]
+
+        self._window = list(observed_ids)
+        self._primed = True
+        return events
+
+    async def events(self) -> AsyncIterator[ListingEvent]:
+        while True:
+            try:
+                events = await self.poll()
+            except CSFloatError as exc:
+                events = [ListingEvent(ListingEvent.ERROR, None, error=exc)]
+            for event in events:
+                yield event
+            await asyncio.sleep(self.interval)
+
+    def __aiter__(self) -> AsyncIterator[ListingEvent]:
+        return self.events()
+
+    async def run(self) -> None:
+        """Polls forever, passing every event to the registered callbacks."""
+        async for event in self.events():
+            for callback in self._callbacks:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    await result